@@ -13,15 +13,32 @@ Usage:
     python kepco_simulator.py --telnet-port 6024 --socket-port 6025
 """
 
+import collections
+import re
+import selectors
 import socket
+import sys
 import threading
 import time
 import math
 import random
 import argparse
-import queue as _queue
+
+import numpy as np
+
+# Per-thread RNG for measurement noise: avoids serializing the LIST
+# runner and socket threads on the module-level random.Random.
+_tls = threading.local()
+
+
+def _rng():
+    r = getattr(_tls, "rng", None)
+    if r is None:
+        r = _tls.rng = random.Random()
+    return r
 
 # ── GUI ─────────────────────────────────────────────────────────────────────
+import tkinter as tk
 import customtkinter as ctk
 
 # ── Constants ───────────────────────────────────────────────────────────────
@@ -31,11 +48,56 @@ MAX_LIST_POINTS    = 1002
 MAX_SEQ_POINTS     = 512
 INPUT_BUFFER_LIMIT = 253        # BIT 802E input buffer size
 NOISE_AMPLITUDE    = 0.002      # ±2 mV / mA measurement noise
+_NOISE_SPAN        = 2 * NOISE_AMPLITUDE
 LIST_DWELL_MIN     = 0.0005     # 500 µs
 LIST_DWELL_MAX     = 10.0       # 10 s
 MAX_RX_LINE_BYTES  = 64_000_000 # guardrail for malformed/no-newline payloads
 MAX_LOG_TEXT       = 1200       # truncate oversized log lines for GUI safety
 
+# Immutable output/setpoint snapshot: handlers publish a whole new
+# tuple per mutation (one reference store, atomic under the GIL), so
+# readers see a consistent state without taking the device lock.
+OutputState = collections.namedtuple(
+    "OutputState", "on func_mode volt_set curr_set volt_saved curr_saved")
+
+# Keyword extractor for parameterized SCPI commands ("VOLT 5.0",
+# "LIST:VOLT 1,2,3" …): one precompiled C-level scan pulls out the token
+# ahead of the whitespace that the prefix dispatch table is keyed on.
+_SCPI_KEYWORD_RE = re.compile(r"^([A-Z:]+)[ \t]")
+
+# SCPI long-form → short-form mnemonics.  The dispatch tables are keyed
+# on short form only; long-form input is collapsed by one alternation
+# sweep instead of fanning every alias out into extra dict keys.
+_SCPI_LONGFORMS = {
+    "VOLTAGE": "VOLT", "CURRENT": "CURR", "MEASURE": "MEAS",
+    "SYSTEM": "SYST", "ERROR": "ERR", "VERSION": "VERS",
+    "OUTPUT": "OUTP", "FUNCTION": "FUNC", "FIXED": "FIX",
+    "CLEAR": "CLE", "DWELL": "DWEL", "POINTS": "POIN",
+    "COUNT": "COUN", "DIRECTION": "DIR", "GENERATION": "GEN",
+    "DSEQUENCE": "DSEQ", "SEQUENCE": "SEQ", "QUERY": "QUER",
+    "STATUS": "STAT", "OPERATION": "OPER", "CONDITION": "COND",
+    "ENABLE": "ENAB", "QUESTIONABLE": "QUES", "INITIATE": "INIT",
+    "IMMEDIATE": "IMM", "CONTINUOUS": "CONT", "ABORT": "ABOR",
+    "TRIGGER": "TRIG", "SCALAR": "SCAL",
+}
+_SCPI_LONG_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(_SCPI_LONGFORMS, key=len, reverse=True))
+    + r")\b")
+# Optional nodes the real firmware accepts but that carry no meaning
+# here: MEAS:SCAL/:DC, OUTP:STAT, SYST:ERR:NEXT, INIT:IMM.
+_SCPI_OPT_NODE_RE = re.compile(r":(?:SCAL|DC|STAT|NEXT|IMM)\b")
+
+
+# Prebound SCPI numeric formatter: the "{:.6E}" spec is parsed once
+# instead of on every measurement or setpoint query.
+_fmt_e = "{:.6E}".format
+
+
+def _canonicalize(cmd_upper):
+    """Collapse long-form mnemonics and optional nodes to short form."""
+    s = _SCPI_LONG_RE.sub(lambda m: _SCPI_LONGFORMS[m.group()], cmd_upper)
+    return _SCPI_OPT_NODE_RE.sub("", s)
+
 # ── Colour palette (matches kepco_ui.py material style) ─────────────────────
 C = dict(
     bg="#121212", surface="#1e1e2e", card="#2a2a3c",
@@ -63,19 +125,27 @@ class KepcoDevice:
         self._list_stop_event = threading.Event()
         self._list_thread = None
         self._on_state_change = on_state_change   # callable()
-        self._on_log = on_log                     # callable(direction, text)
+        # no-op default drops the per-call "is there a sink?" branch
+        self._on_log = on_log or (lambda direction, text: None)
+        self._build_dispatch_tables()
         self.reset(log=False)
 
     # ── reset to power-on defaults ────────────────────────────────────────
     def reset(self, *, log=True):
+        # Retire a runner mid-dwell before reinitializing: clearing
+        # list_running alone leaves it asleep in its Event.wait (up to
+        # LIST_DWELL_MAX), where it would trample the state of any run
+        # started in the meantime and then stop it from its finally.
+        self._list_stop_event.set()
+        t = self._list_thread
+        if (t is not None and t is not threading.current_thread()
+                and t.is_alive()):
+            t.join(timeout=1.0)
         with self._lock:
-            # output
-            self.output_on      = False
-            self.func_mode      = "VOLT"          # VOLT or CURR
-            self.volt_setpoint  = 0.0
-            self.curr_setpoint  = 0.0
-            self.volt_saved     = 0.0             # saved when OUTP OFF
-            self.curr_saved     = 0.0
+            # output (single immutable snapshot — see OutputState)
+            self._out = OutputState(on=False, func_mode="VOLT",
+                                    volt_set=0.0, curr_set=0.0,
+                                    volt_saved=0.0, curr_saved=0.0)
             # range
             self.volt_range_auto = True
             self.curr_range_auto = True
@@ -84,10 +154,20 @@ class KepcoDevice:
             # mode
             self.volt_mode      = "FIX"           # FIX / LIST / TRAN
             self.curr_mode      = "FIX"
-            # LIST subsystem
-            self.list_volt      = []              # up to 1002 float
-            self.list_curr      = []
-            self.list_dwel      = []              # up to 1002 float
+            # LIST subsystem — preallocated float64 buffers with a
+            # fill counter: appends write into the next free slots and
+            # indexed reads hit contiguous unboxed doubles.
+            self.list_volt      = np.empty(MAX_LIST_POINTS, np.float64)
+            self.list_volt_n    = 0
+            self.list_curr      = np.empty(MAX_LIST_POINTS, np.float64)
+            self.list_curr_n    = 0
+            self.list_dwel      = np.empty(MAX_LIST_POINTS, np.float64)
+            self.list_dwel_n    = 0
+            # preformatted .6E strings, maintained on append so the
+            # polled LIST:…? queries only join cached values
+            self.list_volt_fmt  = []
+            self.list_curr_fmt  = []
+            self.list_dwel_fmt  = []
             self.list_count     = 1
             self.list_count_skip = 0
             self.list_dir       = "UP"
@@ -110,25 +190,53 @@ class KepcoDevice:
             self.ques_cond       = 0
             self.ques_enable     = 0
             self.ques_event      = 0
-            # error queue
-            self.error_queue     = []
+            # error queue (bounded per SCPI convention; maxlen drops the
+            # oldest entry in O(1) instead of growing without limit)
+            self.error_queue     = collections.deque(maxlen=32)
             # stats
             self.cmd_count       = 0
             self.query_count     = 0
+            self._publish_meas()
         if log:
             self._notify()
 
+    # ── output-state views (read-only; writers swap self._out) ────────────
+    @property
+    def output_on(self):
+        return self._out.on
+
+    @property
+    def func_mode(self):
+        return self._out.func_mode
+
+    @property
+    def volt_setpoint(self):
+        return self._out.volt_set
+
+    @property
+    def curr_setpoint(self):
+        return self._out.curr_set
+
+    @property
+    def volt_saved(self):
+        return self._out.volt_saved
+
+    @property
+    def curr_saved(self):
+        return self._out.curr_saved
+
     # ── helpers ────────────────────────────────────────────────────────────
     def _notify(self):
         if self._on_state_change:
             self._on_state_change()
 
     def _log(self, direction, text):
-        if self._on_log:
-            if isinstance(text, str) and len(text) > MAX_LOG_TEXT:
-                hidden = len(text) - MAX_LOG_TEXT
-                text = f"{text[:MAX_LOG_TEXT]} ... [truncated {hidden} chars]"
-            self._on_log(direction, text)
+        # type() is avoids isinstance's subclass walk; the length guard
+        # only builds the truncation f-string on oversized lines
+        if type(text) is str and len(text) > MAX_LOG_TEXT:
+            hidden = len(text) - MAX_LOG_TEXT
+            text = f"{text[:MAX_LOG_TEXT]} ... [truncated {hidden} chars]"
+        self._on_log(direction, text)
 
     def _push_error(self, code, msg):
         with self._lock:
@@ -137,54 +245,70 @@ class KepcoDevice:
     def _pop_error(self):
         with self._lock:
             if self.error_queue:
-                return self.error_queue.pop(0)
+                return self.error_queue.popleft()
             return (0, "No error")
 
     # ── measurements (simulated) ──────────────────────────────────────────
+    def _publish_meas(self):
+        """Publish measurement inputs as one immutable tuple.
+
+        Called by the writer after any mutation that changes what MEAS
+        would read.  A single attribute store is atomic under the GIL,
+        so readers get a consistent (output_on, volt, curr) snapshot
+        without touching the device lock.
+        """
+        if self.list_running:
+            idx = self.list_step_idx
+            v = (self.list_volt[min(idx, self.list_volt_n - 1)]
+                 if self.list_volt_n else self.volt_setpoint)
+            c = (self.list_curr[min(idx, self.list_curr_n - 1)]
+                 if self.list_curr_n else self.curr_setpoint)
+        else:
+            v = self.volt_setpoint
+            c = self.curr_setpoint
+        self._meas_snapshot = (self.output_on, v, c)
+
     def measure_volt(self):
-        with self._lock:
-            if not self.output_on:
-                return 0.0
-            if self.list_running and self.list_volt:
-                idx = min(self.list_step_idx, len(self.list_volt) - 1)
-                base = self.list_volt[idx]
-            else:
-                base = self.volt_setpoint
-            return base + random.uniform(-NOISE_AMPLITUDE, NOISE_AMPLITUDE)
+        on, base, _ = self._meas_snapshot
+        if not on:
+            return 0.0
+        # raw random() + mul-add is cheaper than uniform()'s extra
+        # Python call layer on this polled path
+        return base + _rng().random() * _NOISE_SPAN - NOISE_AMPLITUDE
 
     def measure_curr(self):
-        with self._lock:
-            if not self.output_on:
-                return 0.0
-            if self.list_running and self.list_curr:
-                idx = min(self.list_step_idx, len(self.list_curr) - 1)
-                base = self.list_curr[idx]
-            else:
-                base = self.curr_setpoint
-            return base + random.uniform(-NOISE_AMPLITUDE, NOISE_AMPLITUDE)
+        on, _, base = self._meas_snapshot
+        if not on:
+            return 0.0
+        return base + _rng().random() * _NOISE_SPAN - NOISE_AMPLITUDE
 
     # ── LIST execution engine (background thread) ─────────────────────────
     def _list_runner(self):
         """Simulate LIST execution with realistic dwell timing."""
         try:
+            # Zero-copy views: the mutating LIST handlers refuse edits
+            # while list_running is set (_list_busy), so the buffers are
+            # frozen for the whole run and need not be copied out.
             with self._lock:
                 mode = self.func_mode
-                points = list(self.list_volt if mode == "VOLT" else self.list_curr)
-                dwells = list(self.list_dwel)
+                if mode == "VOLT":
+                    points = self.list_volt[:self.list_volt_n]
+                else:
+                    points = self.list_curr[:self.list_curr_n]
+                dwells = self.list_dwel[:self.list_dwel_n]
                 count  = self.list_count
                 skip   = self.list_count_skip
                 direction = self.list_dir
                 gen    = self.list_gen
-                seq    = list(self.list_seq)
+                seq    = self.list_seq
 
-            if not points:
+            if len(points) == 0:
                 self._push_error(-200, "Execution error; list empty")
                 return
 
             # resolve dwell: if only 1 entry, apply to all; else must match
-            if len(dwells) == 1:
-                dwells = dwells * len(points)
-            elif len(dwells) != len(points):
+            single_dwell = len(dwells) == 1
+            if not single_dwell and len(dwells) != len(points):
                 self._push_error(-221, "Settings conflict; dwell/point mismatch")
                 return
 
@@ -202,11 +326,26 @@ class KepcoDevice:
                 self._push_error(-221, "Settings conflict; empty sequence")
                 return
 
+            # Pre-compile the run: clamp every dwell in one C-level pass,
+            # then materialize plain Python scalars once — iterating and
+            # indexing native ints/floats is cheaper per step than going
+            # through NumPy scalar boxing in this sleep-dominated loop.
+            # A single shared dwell stays a scalar; no point fanning it
+            # out to one entry per step.
+            if single_dwell:
+                the_dwell = min(max(float(dwells[0]), LIST_DWELL_MIN),
+                                LIST_DWELL_MAX)
+            else:
+                clamped_dwells = np.clip(dwells, LIST_DWELL_MIN,
+                                         LIST_DWELL_MAX).tolist()
+            order_first = list(order)
+            order_rest = order_first[skip:]
+
             # iteration loop
             iteration = 0
             total_iters = count if count > 0 else 999999  # 0 = indefinite
             while iteration < total_iters and not self._list_stop_event.is_set():
-                exec_order = order if iteration == 0 else order[skip:]
+                exec_order = order_first if iteration == 0 else order_rest
                 for idx in exec_order:
                     if self._list_stop_event.is_set():
                         return
@@ -215,23 +354,16 @@ class KepcoDevice:
                             return
                         self.list_step_idx = idx
                         self.list_iteration = iteration
-                    dwell = dwells[idx] if idx < len(dwells) else dwells[0]
-                    if dwell < LIST_DWELL_MIN:
-                        dwell = LIST_DWELL_MIN
-                    elif dwell > LIST_DWELL_MAX:
-                        dwell = LIST_DWELL_MAX
+                        self._publish_meas()
+                    dwell = the_dwell if single_dwell else clamped_dwells[idx]
                     self._notify()
 
-                    remaining = dwell
-                    while remaining > 0:
-                        if self._list_stop_event.is_set():
-                            return
-                        with self._lock:
-                            if not self.list_running:
-                                return
-                        sl = 0.05 if remaining > 0.05 else remaining
-                        time.sleep(sl)
-                        remaining -= sl
+                    # Single timed wait on the stop event: honours short
+                    # dwells at OS scheduler resolution and sleeps long
+                    # dwells without periodic wakeups.  _stop_list sets
+                    # the event, so one wake condition covers stop/abort.
+                    if self._list_stop_event.wait(dwell):
+                        return
                 iteration += 1
         finally:
             with self._lock:
@@ -240,6 +372,7 @@ class KepcoDevice:
                     self.volt_mode = "FIX"
                 if self.curr_mode == "LIST":
                     self.curr_mode = "FIX"
+                self._publish_meas()
             self._list_stop_event.set()
             self._notify()
 
@@ -252,6 +385,7 @@ class KepcoDevice:
                 self.list_running = True
                 self.list_step_idx = 0
                 self.list_iteration = 0
+                self._publish_meas()
         if already_running:
             self._push_error(-221, "Settings conflict; list already running")
             return
@@ -268,446 +402,674 @@ class KepcoDevice:
                 self.volt_mode = "FIX"
             if self.curr_mode == "LIST":
                 self.curr_mode = "FIX"
+            self._publish_meas()
         self._list_stop_event.set()
         self._notify()
 
     # ══════════════════════════════════════════════════════════════════════
     #  SCPI Command Processor
     # ══════════════════════════════════════════════════════════════════════
-    def process(self, raw_cmd: str) -> str | None:
-        """Process one raw SCPI command string (may be compound with ;:).
-        Returns response string for queries, None for commands."""
-        # split compound commands   "CMD1;:CMD2"  or  "CMD1;CMD2"
-        parts = []
+    def _run_parts(self, raw_cmd: str) -> list:
+        """Split a possibly-compound command ("CMD1;:CMD2" / "CMD1;CMD2")
+        and dispatch each part, collecting the query responses."""
+        responses = []
         for seg in raw_cmd.split(";"):
             seg = seg.strip()
             if seg.startswith(":"):
                 seg = seg[1:]
-            if seg:
-                parts.append(seg)
-
-        responses = []
-        for part in parts:
-            r = self._dispatch(part)
+            if not seg:
+                continue
+            # Uppercase exactly once per command; interning lets repeated
+            # hot queries (e.g. polled MEAS:VOLT?) reuse the same string
+            # object, so the dispatch dict probe compares by pointer.
+            r = self._dispatch(seg, sys.intern(seg.upper()))
             if r is not None:
                 responses.append(r)
+        return responses
 
+    def process(self, raw_cmd: str) -> str | None:
+        """Process one raw SCPI command string (may be compound with ;:).
+        Returns response string for queries, None for commands."""
+        responses = self._run_parts(raw_cmd)
         self._notify()
         return ";".join(responses) if responses else None
 
-    def _dispatch(self, cmd: str) -> str | None:
-        """Route a single SCPI command to the appropriate handler."""
-        cmd_upper = cmd.upper().strip()
+    def process_raw(self, raw_cmd: str) -> bytes | None:
+        """:meth:`process` variant for the socket layer.
+
+        Returns the complete reply as newline-terminated ASCII bytes
+        ready for ``sendall`` (None when there is nothing to send), so
+        the client handler does no response post-processing.  The
+        single-response case — nearly all real traffic — bypasses the
+        compound join entirely.
+        """
+        responses = self._run_parts(raw_cmd)
+        self._notify()
+        if not responses:
+            return None
+        # errors="replace" mirrors the decode side: a garbage command
+        # (e.g. Telnet IAC bytes) puts U+FFFD into the -100 error text,
+        # and the SYST:ERR? reply must still encode.
+        if len(responses) == 1:
+            return (responses[0] + "\n").encode("ascii", errors="replace")
+        return (";".join(responses) + "\n").encode("ascii", errors="replace")
+
+    # ── dispatch tables ───────────────────────────────────────────────────
+    def _build_dispatch_tables(self):
+        """Precompute the SCPI routing tables (built once per device).
+
+        ``_exact`` maps the canonical short form of every complete
+        command to its bound handler, so dispatch is a single hash probe
+        instead of a linear walk over ~80 comparisons; long-form aliases
+        are folded onto these keys by :func:`_canonicalize` on a miss.
+        ``_prefix`` maps the keyword before the first space for the
+        parameterized commands (``VOLT 5.0``, ``LIST:VOLT 1,2,3`` …).
+        """
+        self._exact = {
+            # IEEE 488.2 common commands
+            "*IDN?": self._h_idn,
+            "*RST": self._h_rst,
+            "*CLS": self._h_cls,
+            "*ESR?": self._h_esr_q,
+            "*STB?": self._h_stb_q,
+            "*OPC?": self._h_opc_q,
+            "*OPC": self._h_opc,
+            "*WAI": self._h_noop,
+            # SYSTEM
+            "SYST:ERR?": self._h_err_q,
+            "SYST:ERR:ALL?": self._h_err_all_q,
+            "SYST:VERS?": self._h_vers_q,
+            # OUTPUT
+            "OUTP ON": self._h_outp_on,
+            "OUTP 1": self._h_outp_on,
+            "OUTP OFF": self._h_outp_off,
+            "OUTP 0": self._h_outp_off,
+            "OUTP?": self._h_outp_q,
+            # FUNC:MODE
+            "FUNC:MODE VOLT": self._h_func_volt,
+            "FUNC:MODE CURR": self._h_func_curr,
+            "FUNC:MODE?": self._h_func_q,
+            # setpoint / measurement queries
+            "VOLT?": self._h_volt_q,
+            "CURR?": self._h_curr_q,
+            "MEAS:VOLT?": self._h_meas_volt_q,
+            "MEAS:CURR?": self._h_meas_curr_q,
+            # VOLT:MODE / CURR:MODE
+            "VOLT:MODE FIX": self._h_volt_mode_fix,
+            "VOLT:MODE LIST": self._h_volt_mode_list,
+            "VOLT:MODE?": self._h_volt_mode_q,
+            "CURR:MODE FIX": self._h_curr_mode_fix,
+            "CURR:MODE LIST": self._h_curr_mode_list,
+            "CURR:MODE?": self._h_curr_mode_q,
+            # ranges
+            "VOLT:RANG:AUTO?": self._h_volt_rang_auto_q,
+            "VOLT:RANG?": self._h_volt_rang_q,
+            "CURR:RANG:AUTO?": self._h_curr_rang_auto_q,
+            "CURR:RANG?": self._h_curr_rang_q,
+            # LIST subsystem
+            "LIST:CLE": self._h_list_cle,
+            "LIST:VOLT?": self._h_list_volt_q,
+            "LIST:VOLT:POIN?": self._h_list_volt_poin_q,
+            "LIST:CURR?": self._h_list_curr_q,
+            "LIST:CURR:POIN?": self._h_list_curr_poin_q,
+            "LIST:DWEL?": self._h_list_dwel_q,
+            "LIST:DWEL:POIN?": self._h_list_dwel_poin_q,
+            "LIST:COUN:SKIP?": self._h_list_coun_skip_q,
+            "LIST:COUN?": self._h_list_coun_q,
+            "LIST:DIR UP": self._h_list_dir_up,
+            "LIST:DIR DOWN": self._h_list_dir_down,
+            "LIST:DIR?": self._h_list_dir_q,
+            "LIST:GEN DSEQ": self._h_list_gen_dseq,
+            "LIST:GEN SEQ": self._h_list_gen_seq,
+            "LIST:GEN?": self._h_list_gen_q,
+            "LIST:SEQ?": self._h_list_seq_q,
+            "LIST:QUER?": self._h_list_quer_q,
+            # STATUS registers
+            "STAT:OPER:COND?": self._h_oper_cond_q,
+            "STAT:OPER:ENAB?": self._h_oper_enab_q,
+            "STAT:OPER?": self._h_oper_event_q,
+            "STAT:QUES:COND?": self._h_ques_cond_q,
+            "STAT:QUES:ENAB?": self._h_ques_enab_q,
+            "STAT:QUES?": self._h_ques_event_q,
+            # INIT / TRIG (stub)
+            "INIT": self._h_noop,
+            "ABOR": self._h_abort,
+            "INIT:CONT?": self._h_init_cont_q,
+            "*TRG": self._h_noop,
+            "TRIG": self._h_noop,
+        }
+
+        self._prefix = {
+            "VOLT":            self._h_volt_set,
+            "CURR":            self._h_curr_set,
+            "VOLT:RANG:AUTO":  self._h_volt_rang_auto_set,
+            "VOLT:RANG":       self._h_volt_rang_set,
+            "CURR:RANG:AUTO":  self._h_curr_rang_auto_set,
+            "CURR:RANG":       self._h_curr_rang_set,
+            "LIST:VOLT":       self._h_list_volt_set,
+            "LIST:CURR":       self._h_list_curr_set,
+            "LIST:DWEL":       self._h_list_dwel_set,
+            "LIST:COUN:SKIP":  self._h_list_coun_skip_set,
+            "LIST:COUN":       self._h_list_coun_set,
+            "LIST:SEQ":        self._h_list_seq_set,
+            "LIST:QUER":       self._h_list_quer_set,
+            "STAT:OPER:ENAB":  self._h_oper_enab_set,
+            "STAT:QUES:ENAB":  self._h_ques_enab_set,
+            "INIT:CONT":       self._h_init_cont_set,
+        }
+
+        # Pre-bound lookups: skips the attribute + method-descriptor
+        # resolution on the two dict probes every command pays for.
+        self._exact_get = self._exact.get
+        self._prefix_get = self._prefix.get
+        self._kw_match = _SCPI_KEYWORD_RE.match
+
+    def _dispatch(self, cmd: str, cmd_upper: str) -> str | None:
+        """Route a single SCPI command to the appropriate handler.
+
+        *cmd_upper* is the pre-stripped, interned uppercase form computed
+        once in :meth:`process` — handlers never re-uppercase.
+        """
         self._log("rx", cmd)
 
+        # Display-only counter: dispatch can run from either server
+        # reactor or the Tk console, so a raced += may drop the odd
+        # increment — tolerable for a stats label, not worth a lock
+        # round-trip per command.
+        self.cmd_count += 1
+
+        handler = self._exact_get(cmd_upper)
+        if handler is None:
+            m = self._kw_match(cmd_upper)
+            if m:
+                handler = self._prefix_get(m.group(1))
+        if handler is None:
+            # Slow path: fold long-form mnemonics / optional nodes onto
+            # the canonical short-form keys and probe again.  Short-form
+            # traffic — everything the dashboard sends — never gets here.
+            canon = _canonicalize(cmd_upper)
+            if canon != cmd_upper:
+                handler = self._exact_get(canon)
+                if handler is None:
+                    m = self._kw_match(canon)
+                    if m:
+                        handler = self._prefix_get(m.group(1))
+                if handler is not None:
+                    # Handlers slice arguments at short-form offsets, so
+                    # the canonical string stands in for the original.
+                    return handler(canon, canon)
+        if handler is None:
+            self._push_error(-100, f"Command error; unrecognised: {cmd}")
+            return None
+        return handler(cmd, cmd_upper)
+
+    # ── IEEE 488.2 common-command handlers ────────────────────────────────
+    def _h_idn(self, cmd, cmd_upper):
+        return self._q("*IDN?", self.IDN)
+
+    def _h_rst(self, cmd, cmd_upper):
+        self.reset()
+        return None
+
+    def _h_cls(self, cmd, cmd_upper):
         with self._lock:
-            self.cmd_count += 1
+            self.esr = 0
+            self.stb = 0
+            self.oper_event = 0
+            self.ques_event = 0
+            self.error_queue.clear()
+        return None
 
-        # ── IEEE 488.2 Common Commands ────────────────────────────────────
-        if cmd_upper == "*IDN?":
-            return self._q("*IDN?", self.IDN)
-        if cmd_upper == "*RST":
-            self.reset()
-            return None
-        if cmd_upper == "*CLS":
-            with self._lock:
-                self.esr = 0
-                self.stb = 0
-                self.oper_event = 0
-                self.ques_event = 0
-                self.error_queue.clear()
-            return None
-        if cmd_upper == "*ESR?":
-            with self._lock:
-                v = self.esr
-                self.esr = 0
-            return self._q("*ESR?", str(v))
-        if cmd_upper == "*STB?":
-            return self._q("*STB?", str(self.stb))
-        if cmd_upper == "*OPC?":
-            return self._q("*OPC?", "1")
-        if cmd_upper == "*OPC":
-            with self._lock:
-                self.esr |= 1  # OPC bit
-            return None
-        if cmd_upper == "*WAI":
-            return None
+    def _h_esr_q(self, cmd, cmd_upper):
+        with self._lock:
+            v = self.esr
+            self.esr = 0
+        return self._q("*ESR?", str(v))
+
+    def _h_stb_q(self, cmd, cmd_upper):
+        return self._q("*STB?", str(self.stb))
+
+    def _h_opc_q(self, cmd, cmd_upper):
+        return self._q("*OPC?", "1")
+
+    def _h_opc(self, cmd, cmd_upper):
+        with self._lock:
+            self.esr |= 1  # OPC bit
+        return None
+
+    def _h_noop(self, cmd, cmd_upper):
+        return None
 
-        # ── SYSTEM ────────────────────────────────────────────────────────
-        if cmd_upper in ("SYST:ERR?", "SYST:ERR:NEXT?", "SYSTEM:ERROR?",
-                         "SYSTEM:ERROR:NEXT?"):
+    # ── SYSTEM handlers ───────────────────────────────────────────────────
+    def _h_err_q(self, cmd, cmd_upper):
+        code, msg = self._pop_error()
+        return self._q(cmd_upper, f'{code},"{msg}"')
+
+    def _h_err_all_q(self, cmd, cmd_upper):
+        errs = []
+        while True:
             code, msg = self._pop_error()
-            return self._q(cmd_upper, f'{code},"{msg}"')
-        if cmd_upper in ("SYST:ERR:ALL?", "SYSTEM:ERROR:ALL?"):
-            errs = []
-            while True:
-                code, msg = self._pop_error()
-                errs.append(f'{code},"{msg}"')
-                if code == 0:
-                    break
-            return self._q(cmd_upper, ";".join(errs))
-        if cmd_upper in ("SYST:VERS?", "SYST:VERSION?",
-                         "SYSTEM:VERSION?"):
-            return self._q(cmd_upper, self.SCPI_VERSION)
-
-        # ── OUTPUT ────────────────────────────────────────────────────────
-        if cmd_upper in ("OUTP ON", "OUTP 1", "OUTPUT ON", "OUTPUT 1",
-                         "OUTP:STAT ON", "OUTP:STAT 1"):
+            errs.append(f'{code},"{msg}"')
+            if code == 0:
+                break
+        return self._q(cmd_upper, ";".join(errs))
+
+    def _h_vers_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, self.SCPI_VERSION)
+
+    # ── OUTPUT handlers ───────────────────────────────────────────────────
+    # Readers stay lock-free (they see one immutable snapshot), but the
+    # _replace-and-store below is a read-modify-write: both server
+    # reactors and the manual console dispatch concurrently, so the
+    # swap itself happens under _lock or one of them loses its update.
+    def _h_outp_on(self, cmd, cmd_upper):
+        with self._lock:
+            o = self._out
+            self._out = o._replace(on=True, volt_set=o.volt_saved,
+                                   curr_set=o.curr_saved)
+            self._publish_meas()
+        return None
+
+    def _h_outp_off(self, cmd, cmd_upper):
+        with self._lock:
+            o = self._out
+            self._out = o._replace(on=False, volt_set=0.0, curr_set=0.0,
+                                   volt_saved=o.volt_set,
+                                   curr_saved=o.curr_set)
+            self._publish_meas()
+        return None
+
+    def _h_outp_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, "1" if self.output_on else "0")
+
+    # ── FUNC:MODE handlers ────────────────────────────────────────────────
+    def _h_func_volt(self, cmd, cmd_upper):
+        with self._lock:
+            self._out = self._out._replace(func_mode="VOLT")
+            self.volt_mode = "FIX"
+            self.curr_mode = "FIX"
+        return None
+
+    def _h_func_curr(self, cmd, cmd_upper):
+        with self._lock:
+            self._out = self._out._replace(func_mode="CURR")
+            self.volt_mode = "FIX"
+            self.curr_mode = "FIX"
+        return None
+
+    def _h_func_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, self.func_mode)
+
+    # ── VOLT / CURR setpoint handlers ─────────────────────────────────────
+    def _h_volt_set(self, cmd, cmd_upper):
+        val = self._parse_float(cmd, 5)
+        if val is not None:
             with self._lock:
-                self.output_on = True
-                self.volt_setpoint = self.volt_saved
-                self.curr_setpoint = self.curr_saved
-            return None
-        if cmd_upper in ("OUTP OFF", "OUTP 0", "OUTPUT OFF", "OUTPUT 0",
-                         "OUTP:STAT OFF", "OUTP:STAT 0"):
+                o = self._out
+                if o.on:
+                    self._out = o._replace(volt_set=val, volt_saved=val)
+                else:
+                    self._out = o._replace(volt_set=val)
+                self._publish_meas()
+        return None
+
+    def _h_volt_q(self, cmd, cmd_upper):
+        return self._q("VOLT?", _fmt_e(self.volt_setpoint))
+
+    def _h_curr_set(self, cmd, cmd_upper):
+        val = self._parse_float(cmd, 5)
+        if val is not None:
             with self._lock:
-                self.volt_saved = self.volt_setpoint
-                self.curr_saved = self.curr_setpoint
-                self.output_on = False
-                self.volt_setpoint = 0.0
-                self.curr_setpoint = 0.0
-            return None
-        if cmd_upper in ("OUTP?", "OUTPUT?", "OUTP:STAT?"):
-            return self._q(cmd_upper,
-                           "1" if self.output_on else "0")
+                o = self._out
+                if o.on:
+                    self._out = o._replace(curr_set=val, curr_saved=val)
+                else:
+                    self._out = o._replace(curr_set=val)
+                self._publish_meas()
+        return None
+
+    def _h_curr_q(self, cmd, cmd_upper):
+        return self._q("CURR?", _fmt_e(self.curr_setpoint))
+
+    # ── MEAS handlers ─────────────────────────────────────────────────────
+    def _h_meas_volt_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, _fmt_e(self.measure_volt()))
+
+    def _h_meas_curr_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, _fmt_e(self.measure_curr()))
+
+    # ── VOLT:MODE / CURR:MODE handlers ────────────────────────────────────
+    def _h_volt_mode_fix(self, cmd, cmd_upper):
+        self._stop_list()
+        with self._lock:
+            self.volt_mode = "FIX"
+        return None
+
+    def _h_volt_mode_list(self, cmd, cmd_upper):
+        with self._lock:
+            self.volt_mode = "LIST"
+        self._start_list("VOLT")
+        return None
+
+    def _h_volt_mode_q(self, cmd, cmd_upper):
+        return self._q("VOLT:MODE?", self.volt_mode)
 
-        # ── FUNC:MODE ─────────────────────────────────────────────────────
-        if cmd_upper in ("FUNC:MODE VOLT", "FUNCTION:MODE VOLT"):
+    def _h_curr_mode_fix(self, cmd, cmd_upper):
+        self._stop_list()
+        with self._lock:
+            self.curr_mode = "FIX"
+        return None
+
+    def _h_curr_mode_list(self, cmd, cmd_upper):
+        with self._lock:
+            self.curr_mode = "LIST"
+        self._start_list("CURR")
+        return None
+
+    def _h_curr_mode_q(self, cmd, cmd_upper):
+        return self._q("CURR:MODE?", self.curr_mode)
+
+    # ── VOLT:RANG / CURR:RANG handlers ────────────────────────────────────
+    def _h_volt_rang_auto_q(self, cmd, cmd_upper):
+        return self._q("VOLT:RANG:AUTO?",
+                       "1" if self.volt_range_auto else "0")
+
+    def _h_volt_rang_auto_set(self, cmd, cmd_upper):
+        flag = "ON" in cmd_upper or "1" in cmd_upper
+        with self._lock:
+            self.volt_range_auto = flag
+        return None
+
+    def _h_volt_rang_set(self, cmd, cmd_upper):
+        val = self._parse_int(cmd, 10)
+        if val is not None:
             with self._lock:
-                self.func_mode = "VOLT"
-                self.volt_mode = "FIX"
-                self.curr_mode = "FIX"
-            return None
-        if cmd_upper in ("FUNC:MODE CURR", "FUNCTION:MODE CURR"):
+                self.volt_range = val
+        return None
+
+    def _h_volt_rang_q(self, cmd, cmd_upper):
+        return self._q("VOLT:RANG?", str(self.volt_range))
+
+    def _h_curr_rang_auto_q(self, cmd, cmd_upper):
+        return self._q("CURR:RANG:AUTO?",
+                       "1" if self.curr_range_auto else "0")
+
+    def _h_curr_rang_auto_set(self, cmd, cmd_upper):
+        flag = "ON" in cmd_upper or "1" in cmd_upper
+        with self._lock:
+            self.curr_range_auto = flag
+        return None
+
+    def _h_curr_rang_set(self, cmd, cmd_upper):
+        val = self._parse_int(cmd, 10)
+        if val is not None:
             with self._lock:
-                self.func_mode = "CURR"
-                self.volt_mode = "FIX"
-                self.curr_mode = "FIX"
-            return None
-        if cmd_upper in ("FUNC:MODE?", "FUNCTION:MODE?"):
-            return self._q(cmd_upper, self.func_mode)
-
-        # ── VOLT / CURR setpoints ─────────────────────────────────────────
-        if cmd_upper.startswith("VOLT ") and ":" not in cmd_upper:
-            val = self._parse_float(cmd, 5)
-            if val is not None:
-                with self._lock:
-                    self.volt_setpoint = val
-                    if self.output_on:
-                        self.volt_saved = val
+                self.curr_range = val
+        return None
+
+    def _h_curr_rang_q(self, cmd, cmd_upper):
+        return self._q("CURR:RANG?", str(self.curr_range))
+
+    # ── LIST handlers ─────────────────────────────────────────────────────
+    def _list_busy(self):
+        """Reject list-buffer edits while a LIST runs.
+
+        :meth:`_list_runner` reads the buffers through zero-copy views,
+        so they must stay frozen until the run finishes.
+        """
+        if self.list_running:
+            self._push_error(-221, "Settings conflict; list running")
+            return True
+        return False
+
+    def _h_list_cle(self, cmd, cmd_upper):
+        if self._list_busy():
             return None
-        if cmd_upper == "VOLT?":
-            return self._q("VOLT?", f"{self.volt_setpoint:.6E}")
-        if cmd_upper.startswith("CURR ") and ":" not in cmd_upper:
-            val = self._parse_float(cmd, 5)
-            if val is not None:
-                with self._lock:
-                    self.curr_setpoint = val
-                    if self.output_on:
-                        self.curr_saved = val
+        with self._lock:
+            self.list_volt_n = 0
+            self.list_curr_n = 0
+            self.list_dwel_n = 0
+            self.list_volt_fmt.clear()
+            self.list_curr_fmt.clear()
+            self.list_dwel_fmt.clear()
+            self.list_seq.clear()
+            self.list_count = 1
+            self.list_count_skip = 0
+            self.list_dir = "UP"
+            self.list_gen = "DSEQ"
+            self.list_query_ptr = 0
+        return None
+
+    def _h_list_volt_set(self, cmd, cmd_upper):
+        if self._list_busy():
             return None
-        if cmd_upper == "CURR?":
-            return self._q("CURR?", f"{self.curr_setpoint:.6E}")
-
-        # ── MEAS ──────────────────────────────────────────────────────────
-        if cmd_upper in ("MEAS:VOLT?", "MEAS:SCAL:VOLT?",
-                         "MEASURE:VOLTAGE?", "MEASURE:SCALAR:VOLTAGE?",
-                         "MEAS:VOLT:DC?", "MEAS:SCAL:VOLT:DC?"):
-            return self._q(cmd_upper, f"{self.measure_volt():.6E}")
-        if cmd_upper in ("MEAS:CURR?", "MEAS:SCAL:CURR?",
-                         "MEASURE:CURRENT?", "MEASURE:SCALAR:CURRENT?",
-                         "MEAS:CURR:DC?", "MEAS:SCAL:CURR:DC?"):
-            return self._q(cmd_upper, f"{self.measure_curr():.6E}")
-
-        # ── VOLT:MODE / CURR:MODE ────────────────────────────────────────
-        if cmd_upper in ("VOLT:MODE FIX", "VOLT:MODE FIXED"):
-            self._stop_list()
-            with self._lock:
-                self.volt_mode = "FIX"
+        if self.list_curr_n:
+            self._push_error(-221, "Settings conflict")
             return None
-        if cmd_upper in ("VOLT:MODE LIST",):
-            with self._lock:
-                self.volt_mode = "LIST"
-            self._start_list("VOLT")
+        with self._lock:
+            space = MAX_LIST_POINTS - self.list_volt_n
+        if space <= 0:
             return None
-        if cmd_upper == "VOLT:MODE?":
-            return self._q("VOLT:MODE?", self.volt_mode)
+        vals = self._parse_float_list(cmd, 10, max_items=space)
+        with self._lock:
+            n = self.list_volt_n
+            k = min(len(vals), space)
+            self.list_volt[n:n + k] = vals[:k]
+            self.list_volt_n = n + k
+            self.list_volt_fmt.extend(map(_fmt_e, vals[:k]))
+        return None
 
-        if cmd_upper in ("CURR:MODE FIX", "CURR:MODE FIXED"):
-            self._stop_list()
-            with self._lock:
-                self.curr_mode = "FIX"
-            return None
-        if cmd_upper in ("CURR:MODE LIST",):
-            with self._lock:
-                self.curr_mode = "LIST"
-            self._start_list("CURR")
+    def _h_list_volt_q(self, cmd, cmd_upper):
+        with self._lock:
+            start = self.list_query_ptr
+            chunk = self.list_volt_fmt[start:start + 16]
+        return self._q(cmd_upper, ",".join(chunk) if chunk else "")
+
+    def _h_list_volt_poin_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.list_volt_n))
+
+    def _h_list_curr_set(self, cmd, cmd_upper):
+        if self._list_busy():
             return None
-        if cmd_upper == "CURR:MODE?":
-            return self._q("CURR:MODE?", self.curr_mode)
-
-        # ── VOLT:RANG / CURR:RANG ────────────────────────────────────────
-        if cmd_upper == "VOLT:RANG:AUTO?":
-            return self._q("VOLT:RANG:AUTO?",
-                           "1" if self.volt_range_auto else "0")
-        if cmd_upper.startswith("VOLT:RANG:AUTO"):
-            flag = "ON" in cmd_upper or "1" in cmd_upper
-            with self._lock:
-                self.volt_range_auto = flag
+        if self.list_volt_n:
+            self._push_error(-221, "Settings conflict")
             return None
-        if cmd_upper.startswith("VOLT:RANG "):
-            val = self._parse_int(cmd, 10)
-            if val is not None:
-                with self._lock:
-                    self.volt_range = val
+        with self._lock:
+            space = MAX_LIST_POINTS - self.list_curr_n
+        if space <= 0:
             return None
-        if cmd_upper == "VOLT:RANG?":
-            return self._q("VOLT:RANG?", str(self.volt_range))
-
-        if cmd_upper == "CURR:RANG:AUTO?":
-            return self._q("CURR:RANG:AUTO?",
-                           "1" if self.curr_range_auto else "0")
-        if cmd_upper.startswith("CURR:RANG:AUTO"):
-            flag = "ON" in cmd_upper or "1" in cmd_upper
-            with self._lock:
-                self.curr_range_auto = flag
+        vals = self._parse_float_list(cmd, 10, max_items=space)
+        with self._lock:
+            n = self.list_curr_n
+            k = min(len(vals), space)
+            self.list_curr[n:n + k] = vals[:k]
+            self.list_curr_n = n + k
+            self.list_curr_fmt.extend(map(_fmt_e, vals[:k]))
+        return None
+
+    def _h_list_curr_q(self, cmd, cmd_upper):
+        with self._lock:
+            start = self.list_query_ptr
+            chunk = self.list_curr_fmt[start:start + 16]
+        return self._q(cmd_upper, ",".join(chunk) if chunk else "")
+
+    def _h_list_curr_poin_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.list_curr_n))
+
+    def _h_list_dwel_set(self, cmd, cmd_upper):
+        if self._list_busy():
             return None
-        if cmd_upper.startswith("CURR:RANG "):
-            val = self._parse_int(cmd, 10)
-            if val is not None:
-                with self._lock:
-                    self.curr_range = val
+        with self._lock:
+            space = MAX_LIST_POINTS - self.list_dwel_n
+        if space <= 0:
             return None
-        if cmd_upper == "CURR:RANG?":
-            return self._q("CURR:RANG?", str(self.curr_range))
+        vals = self._parse_float_list(cmd, 10, max_items=space)
+        out_of_range = bool(((vals < LIST_DWELL_MIN)
+                             | (vals > LIST_DWELL_MAX)).any())
+        if out_of_range:
+            self._push_error(
+                -222,
+                (f"Data out of range; dwell must be "
+                 f"{LIST_DWELL_MIN}..{LIST_DWELL_MAX} s"),
+            )
+        vals = np.clip(vals, LIST_DWELL_MIN, LIST_DWELL_MAX)
+        with self._lock:
+            n = self.list_dwel_n
+            k = min(len(vals), space)
+            self.list_dwel[n:n + k] = vals[:k]
+            self.list_dwel_n = n + k
+            self.list_dwel_fmt.extend(map(_fmt_e, vals[:k]))
+        return None
 
-        # ── LIST:CLE / LIST:CLEAR ────────────────────────────────────────
-        if cmd_upper in ("LIST:CLE", "LIST:CLEAR"):
-            with self._lock:
-                self.list_volt.clear()
-                self.list_curr.clear()
-                self.list_dwel.clear()
-                self.list_seq.clear()
-                self.list_count = 1
-                self.list_count_skip = 0
-                self.list_dir = "UP"
-                self.list_gen = "DSEQ"
-                self.list_query_ptr = 0
-            return None
+    def _h_list_dwel_q(self, cmd, cmd_upper):
+        with self._lock:
+            start = self.list_query_ptr
+            chunk = self.list_dwel_fmt[start:start + 16]
+        return self._q(cmd_upper, ",".join(chunk) if chunk else "")
 
-        # ── LIST:VOLT ─────────────────────────────────────────────────────
-        if cmd_upper.startswith("LIST:VOLT ") and "POIN" not in cmd_upper:
-            if self.list_curr:
-                self._push_error(-221, "Settings conflict")
-                return None
-            with self._lock:
-                space = MAX_LIST_POINTS - len(self.list_volt)
-            if space <= 0:
-                return None
-            vals = self._parse_float_list(cmd, 10, max_items=space)
-            with self._lock:
-                self.list_volt.extend(vals[:space])
-            return None
-        if cmd_upper in ("LIST:VOLT?", "LIST:VOLTAGE?"):
-            with self._lock:
-                start = self.list_query_ptr
-                chunk = self.list_volt[start:start + 16]
-            return self._q(cmd_upper,
-                           ",".join(f"{v:.6E}" for v in chunk) if chunk else "")
-        if cmd_upper in ("LIST:VOLT:POIN?", "LIST:VOLT:POINTS?",
-                         "LIST:VOLTAGE:POINTS?"):
-            return self._q(cmd_upper, str(len(self.list_volt)))
-
-        # ── LIST:CURR ─────────────────────────────────────────────────────
-        if cmd_upper.startswith("LIST:CURR ") and "POIN" not in cmd_upper:
-            if self.list_volt:
-                self._push_error(-221, "Settings conflict")
-                return None
+    def _h_list_dwel_poin_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.list_dwel_n))
+
+    def _h_list_coun_skip_set(self, cmd, cmd_upper):
+        val = self._parse_int(cmd, 15)
+        if val is not None:
             with self._lock:
-                space = MAX_LIST_POINTS - len(self.list_curr)
-            if space <= 0:
-                return None
-            vals = self._parse_float_list(cmd, 10, max_items=space)
+                self.list_count_skip = val
+        return None
+
+    def _h_list_coun_skip_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.list_count_skip))
+
+    def _h_list_coun_set(self, cmd, cmd_upper):
+        val = self._parse_int(cmd, 10)
+        if val is not None:
             with self._lock:
-                self.list_curr.extend(vals[:space])
+                self.list_count = val
+        return None
+
+    def _h_list_coun_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.list_count))
+
+    def _h_list_dir_up(self, cmd, cmd_upper):
+        with self._lock:
+            self.list_dir = "UP"
+        return None
+
+    def _h_list_dir_down(self, cmd, cmd_upper):
+        with self._lock:
+            self.list_dir = "DOWN"
+        return None
+
+    def _h_list_dir_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, self.list_dir)
+
+    def _h_list_gen_dseq(self, cmd, cmd_upper):
+        with self._lock:
+            self.list_gen = "DSEQ"
+        return None
+
+    def _h_list_gen_seq(self, cmd, cmd_upper):
+        with self._lock:
+            self.list_gen = "SEQ"
+        return None
+
+    def _h_list_gen_q(self, cmd, cmd_upper):
+        if self.list_running:
+            self._push_error(-221, "Settings conflict; list running")
             return None
-        if cmd_upper in ("LIST:CURR?", "LIST:CURRENT?"):
-            with self._lock:
-                start = self.list_query_ptr
-                chunk = self.list_curr[start:start + 16]
-            return self._q(cmd_upper,
-                           ",".join(f"{v:.6E}" for v in chunk) if chunk else "")
-        if cmd_upper in ("LIST:CURR:POIN?", "LIST:CURR:POINTS?",
-                         "LIST:CURRENT:POINTS?"):
-            return self._q(cmd_upper, str(len(self.list_curr)))
-
-        # ── LIST:DWEL ─────────────────────────────────────────────────────
-        if cmd_upper.startswith("LIST:DWEL ") and "POIN" not in cmd_upper:
-            with self._lock:
-                space = MAX_LIST_POINTS - len(self.list_dwel)
-            if space <= 0:
-                return None
-            vals = self._parse_float_list(cmd, 10, max_items=space)
-            out_of_range = any(v < LIST_DWELL_MIN or v > LIST_DWELL_MAX
-                               for v in vals)
-            if out_of_range:
-                self._push_error(
-                    -222,
-                    (f"Data out of range; dwell must be "
-                     f"{LIST_DWELL_MIN}..{LIST_DWELL_MAX} s"),
-                )
-            vals = [
-                LIST_DWELL_MIN if v < LIST_DWELL_MIN else
-                LIST_DWELL_MAX if v > LIST_DWELL_MAX else v
-                for v in vals
-            ]
-            with self._lock:
-                self.list_dwel.extend(vals[:space])
+        return self._q(cmd_upper, self.list_gen)
+
+    def _h_list_seq_set(self, cmd, cmd_upper):
+        if "?" in cmd_upper:
             return None
-        if cmd_upper in ("LIST:DWEL?", "LIST:DWELL?"):
-            with self._lock:
-                start = self.list_query_ptr
-                chunk = self.list_dwel[start:start + 16]
-            return self._q(cmd_upper,
-                           ",".join(f"{v:.6E}" for v in chunk) if chunk else "")
-        if cmd_upper in ("LIST:DWEL:POIN?", "LIST:DWELL:POINTS?"):
-            return self._q(cmd_upper, str(len(self.list_dwel)))
-
-        # ── LIST:COUN ─────────────────────────────────────────────────────
-        if cmd_upper.startswith("LIST:COUN:SKIP "):
-            val = self._parse_int(cmd, 15)
-            if val is not None:
-                with self._lock:
-                    self.list_count_skip = val
+        if self._list_busy():
             return None
-        if cmd_upper in ("LIST:COUN:SKIP?", "LIST:COUNT:SKIP?"):
-            return self._q(cmd_upper, str(self.list_count_skip))
-        if cmd_upper.startswith("LIST:COUN "):
-            val = self._parse_int(cmd, 10)
-            if val is not None:
-                with self._lock:
-                    self.list_count = val
+        with self._lock:
+            space = MAX_SEQ_POINTS - len(self.list_seq)
+        if space <= 0:
             return None
-        if cmd_upper in ("LIST:COUN?", "LIST:COUNT?"):
-            return self._q(cmd_upper, str(self.list_count))
+        vals = self._parse_int_list(cmd, 9, max_items=space)
+        with self._lock:
+            self.list_seq.extend(vals[:space].tolist())
+        return None
 
-        # ── LIST:DIR ──────────────────────────────────────────────────────
-        if cmd_upper in ("LIST:DIR UP", "LIST:DIRECTION UP"):
-            with self._lock:
-                self.list_dir = "UP"
-            return None
-        if cmd_upper in ("LIST:DIR DOWN", "LIST:DIRECTION DOWN"):
-            with self._lock:
-                self.list_dir = "DOWN"
-            return None
-        if cmd_upper in ("LIST:DIR?", "LIST:DIRECTION?"):
-            return self._q(cmd_upper, self.list_dir)
+    def _h_list_seq_q(self, cmd, cmd_upper):
+        with self._lock:
+            start = self.list_query_ptr
+            chunk = self.list_seq[start:start + 16]
+        return self._q(cmd_upper,
+                       ",".join(str(v) for v in chunk) if chunk else "")
 
-        # ── LIST:GEN ──────────────────────────────────────────────────────
-        if cmd_upper in ("LIST:GEN DSEQ", "LIST:GEN DSEQUENCE",
-                         "LIST:GENERATION DSEQ", "LIST:GENERATION DSEQUENCE"):
-            with self._lock:
-                self.list_gen = "DSEQ"
+    def _h_list_quer_set(self, cmd, cmd_upper):
+        if "?" in cmd_upper:
             return None
-        if cmd_upper in ("LIST:GEN SEQ", "LIST:GEN SEQUENCE",
-                         "LIST:GENERATION SEQ", "LIST:GENERATION SEQUENCE"):
+        val = self._parse_int(cmd, 10)
+        if val is not None:
             with self._lock:
-                self.list_gen = "SEQ"
-            return None
-        if cmd_upper in ("LIST:GEN?", "LIST:GENERATION?"):
-            if self.list_running:
-                self._push_error(-221, "Settings conflict; list running")
-                return None
-            return self._q(cmd_upper, self.list_gen)
+                self.list_query_ptr = val
+        return None
 
-        # ── LIST:SEQ ──────────────────────────────────────────────────────
-        if cmd_upper.startswith("LIST:SEQ ") and "?" not in cmd_upper:
-            with self._lock:
-                space = MAX_SEQ_POINTS - len(self.list_seq)
-            if space <= 0:
-                return None
-            vals = self._parse_int_list(cmd, 9, max_items=space)
-            with self._lock:
-                self.list_seq.extend(vals[:space])
-            return None
-        if cmd_upper in ("LIST:SEQ?", "LIST:SEQUENCE?"):
-            with self._lock:
-                start = self.list_query_ptr
-                chunk = self.list_seq[start:start + 16]
-            return self._q(cmd_upper,
-                           ",".join(str(v) for v in chunk) if chunk else "")
-
-        # ── LIST:QUER ─────────────────────────────────────────────────────
-        if cmd_upper.startswith("LIST:QUER ") and "?" not in cmd_upper:
-            val = self._parse_int(cmd, 10)
-            if val is not None:
-                with self._lock:
-                    self.list_query_ptr = val
-            return None
-        if cmd_upper in ("LIST:QUER?", "LIST:QUERY?"):
-            return self._q(cmd_upper, str(self.list_query_ptr))
-
-        # ── STATUS registers ──────────────────────────────────────────────
-        if cmd_upper in ("STAT:OPER:COND?", "STATUS:OPERATION:CONDITION?"):
-            return self._q(cmd_upper, str(self.oper_cond))
-        if cmd_upper in ("STAT:OPER:ENAB?", "STATUS:OPERATION:ENABLE?"):
-            return self._q(cmd_upper, str(self.oper_enable))
-        if cmd_upper.startswith("STAT:OPER:ENAB"):
-            val = self._parse_int(cmd, 15)
-            if val is not None:
-                with self._lock:
-                    self.oper_enable = val
-            return None
-        if cmd_upper in ("STAT:OPER?", "STATUS:OPERATION?"):
-            with self._lock:
-                v = self.oper_event
-                self.oper_event = 0
-            return self._q(cmd_upper, str(v))
-
-        if cmd_upper in ("STAT:QUES:COND?",
-                         "STATUS:QUESTIONABLE:CONDITION?"):
-            return self._q(cmd_upper, str(self.ques_cond))
-        if cmd_upper in ("STAT:QUES:ENAB?",
-                         "STATUS:QUESTIONABLE:ENABLE?"):
-            return self._q(cmd_upper, str(self.ques_enable))
-        if cmd_upper.startswith("STAT:QUES:ENAB"):
-            val = self._parse_int(cmd, 15)
-            if val is not None:
-                with self._lock:
-                    self.ques_enable = val
-            return None
-        if cmd_upper in ("STAT:QUES?", "STATUS:QUESTIONABLE?"):
+    def _h_list_quer_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.list_query_ptr))
+
+    # ── STATUS register handlers ──────────────────────────────────────────
+    def _h_oper_cond_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.oper_cond))
+
+    def _h_oper_enab_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.oper_enable))
+
+    def _h_oper_enab_set(self, cmd, cmd_upper):
+        val = self._parse_int(cmd, 15)
+        if val is not None:
             with self._lock:
-                v = self.ques_event
-                self.ques_event = 0
-            return self._q(cmd_upper, str(v))
+                self.oper_enable = val
+        return None
 
-        # ── INIT / TRIG (stub) ────────────────────────────────────────────
-        if cmd_upper in ("INIT", "INIT:IMM", "INITIATE:IMMEDIATE"):
-            return None
-        if cmd_upper in ("ABOR", "ABORT"):
-            self._stop_list()
-            return None
-        if cmd_upper in ("INIT:CONT?", "INITIATE:CONTINUOUS?"):
-            return self._q(cmd_upper,
-                           "1" if self.init_cont else "0")
-        if cmd_upper.startswith("INIT:CONT"):
-            flag = "ON" in cmd_upper or "1" in cmd_upper
+    def _h_oper_event_q(self, cmd, cmd_upper):
+        with self._lock:
+            v = self.oper_event
+            self.oper_event = 0
+        return self._q(cmd_upper, str(v))
+
+    def _h_ques_cond_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.ques_cond))
+
+    def _h_ques_enab_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, str(self.ques_enable))
+
+    def _h_ques_enab_set(self, cmd, cmd_upper):
+        val = self._parse_int(cmd, 15)
+        if val is not None:
             with self._lock:
-                self.init_cont = flag
-            return None
-        if cmd_upper in ("*TRG", "TRIG", "TRIGGER"):
-            return None
+                self.ques_enable = val
+        return None
+
+    def _h_ques_event_q(self, cmd, cmd_upper):
+        with self._lock:
+            v = self.ques_event
+            self.ques_event = 0
+        return self._q(cmd_upper, str(v))
+
+    # ── INIT / TRIG handlers ──────────────────────────────────────────────
+    def _h_abort(self, cmd, cmd_upper):
+        self._stop_list()
+        return None
 
-        # ── Unrecognised ──────────────────────────────────────────────────
-        self._push_error(-100, f"Command error; unrecognised: {cmd}")
+    def _h_init_cont_q(self, cmd, cmd_upper):
+        return self._q(cmd_upper, "1" if self.init_cont else "0")
+
+    def _h_init_cont_set(self, cmd, cmd_upper):
+        flag = "ON" in cmd_upper or "1" in cmd_upper
+        with self._lock:
+            self.init_cont = flag
         return None
 
     # ── query helper ──────────────────────────────────────────────────────
     def _q(self, label, value):
-        with self._lock:
-            self.query_count += 1
-        self._log("tx", f"{value}")
+        # Display-only counter — see cmd_count in _dispatch.
+        self.query_count += 1
+        self._log("tx", value)
         return value
 
     # ── parsing helpers ───────────────────────────────────────────────────
@@ -727,70 +1089,78 @@ class KepcoDevice:
 
     @staticmethod
     def _parse_float_list(cmd, offset, max_items=None):
+        """Parse a comma-separated float payload in one C-level pass."""
         try:
-            payload = cmd[offset:]
-            if max_items is None:
-                return [float(x) for x in payload.split(",")]
-
-            out = []
-            start = 0
-            while len(out) < max_items:
-                idx = payload.find(",", start)
-                if idx < 0:
-                    token = payload[start:].strip()
-                    if token:
-                        out.append(float(token))
-                    break
-                token = payload[start:idx].strip()
-                if token:
-                    out.append(float(token))
-                start = idx + 1
-            return out
+            vals = np.fromstring(cmd[offset:], dtype=np.float64, sep=",")
         except ValueError:
-            return []
+            return np.empty(0, np.float64)
+        if max_items is not None:
+            vals = vals[:max_items]
+        return vals
 
     @staticmethod
     def _parse_int_list(cmd, offset, max_items=None):
-        try:
-            payload = cmd[offset:]
-            if max_items is None:
-                return [int(float(x)) for x in payload.split(",")]
-
-            out = []
-            start = 0
-            while len(out) < max_items:
-                idx = payload.find(",", start)
-                if idx < 0:
-                    token = payload[start:].strip()
-                    if token:
-                        out.append(int(float(token)))
-                    break
-                token = payload[start:idx].strip()
-                if token:
-                    out.append(int(float(token)))
-                start = idx + 1
-            return out
-        except ValueError:
-            return []
+        # Parse as float first so "3.0" still truncates to 3, matching
+        # the int(float(x)) behaviour of the old per-token loop.
+        vals = KepcoDevice._parse_float_list(cmd, offset, max_items)
+        return vals.astype(np.int64)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  TCP Server
 # ═══════════════════════════════════════════════════════════════════════════
+# Commands that make the sending connection the LIST owner (the run is
+# aborted if that client disconnects).
+_LIST_START_CMDS = frozenset(("VOLT:MODE LIST", "CURR:MODE LIST"))
+
+
+class _Client:
+    """Per-connection state for the reactor: receive buffer with its
+    scan offset, plus bytes waiting for the socket to become writable."""
+
+    __slots__ = ("conn", "addr", "buf", "scan_from", "out")
+
+    def __init__(self, conn, addr):
+        self.conn = conn
+        self.addr = addr
+        self.buf = bytearray()
+        self.scan_from = 0  # no b"\n" before this offset (already scanned)
+        self.out = bytearray()
+
+
 class SCPIServer:
-    """Multi-client TCP server on localhost."""
+    """Multi-client TCP server on localhost.
+
+    One reactor thread multiplexes every connection through a
+    ``selectors.DefaultSelector`` (epoll on Linux): no per-client thread,
+    no per-client 0.5 s timeout wakeups — the thread sleeps in the
+    kernel until a socket actually has traffic.
+    """
 
     def __init__(self, device: KepcoDevice, port: int, echo: bool = False):
         self.device = device
         self.port = port
         self.echo = echo          # Telnet echo emulation
         self._server_sock = None
-        self._accept_thread = None
+        self._reactor_thread = None
         self._running = False
-        self._clients: list[threading.Thread] = []
-        self._client_socks: set[socket.socket] = set()
-        self._state_lock = threading.Lock()
+        self._clients: dict[socket.socket, _Client] = {}
+        # All connection state — _clients, _list_owner_conn and the
+        # published client_count — is touched only on the reactor
+        # thread; the GUI just reads client_count, which a GIL-atomic
+        # int store keeps consistent without a lock.
         self._list_owner_conn = None
+        self._wakeup_r = None
+        self._wakeup_w = None
+        # Shared receive scratch: the reactor is single-threaded, so one
+        # buffer serves every connection; recv_into fills it in place
+        # instead of allocating a fresh bytes object per packet.
+        self._rx_mv = memoryview(bytearray(8192))
+        # Bounded memo of raw line bytes -> (cmd, starts-a-LIST-run):
+        # a dashboard poll loop replays the same dozen lines, so on a
+        # hit the handler skips the ASCII decode, upper-case and the
+        # per-segment owner scan entirely.
+        self._line_cache: dict[bytes, tuple[str, bool]] = {}
         self.client_count = 0
 
     def start(self):
@@ -799,136 +1169,219 @@ class SCPIServer:
         self._running = True
         self._server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_sock.settimeout(1.0)
-        last_error = None
-        for _ in range(20):
+        # REUSEPORT (where available) lets a restart grab the port
+        # immediately even while the previous listener is tearing down,
+        # replacing the old retry-with-sleep bind loop.
+        if hasattr(socket, "SO_REUSEPORT"):
             try:
-                self._server_sock.bind(("0.0.0.0", self.port))
-                last_error = None
-                break
-            except OSError as e:
-                last_error = e
-                if e.errno != 98:
-                    break
-                time.sleep(0.1)
-        if last_error is not None:
+                self._server_sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        try:
+            self._server_sock.bind(("0.0.0.0", self.port))
+        except OSError:
             self._running = False
             try:
                 self._server_sock.close()
             except OSError:
                 pass
             self._server_sock = None
-            raise last_error
+            raise
         self._server_sock.listen(4)
-        self._accept_thread = threading.Thread(target=self._accept_loop,
-                                               daemon=True)
-        self._accept_thread.start()
+        self._server_sock.setblocking(False)
+        # Self-pipe so stop() can interrupt a blocking select() instantly.
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._reactor_thread = threading.Thread(target=self._reactor,
+                                                daemon=True)
+        self._reactor_thread.start()
 
     def stop(self):
+        if not self._running:
+            return
         self._running = False
-        if self._server_sock:
-            try:
-                self._server_sock.close()
-            except OSError:
-                pass
+        try:
+            self._wakeup_w.send(b"\x00")
+        except OSError:
+            pass
+        if self._reactor_thread and self._reactor_thread.is_alive():
+            self._reactor_thread.join(timeout=1.5)
+        self._reactor_thread = None
+
+    def _reactor(self):
+        sel = selectors.DefaultSelector()
+        sel.register(self._server_sock, selectors.EVENT_READ, None)
+        sel.register(self._wakeup_r, selectors.EVENT_READ, None)
+        try:
+            while self._running:
+                for key, events in sel.select():
+                    if key.data is None:
+                        if key.fileobj is self._server_sock:
+                            self._on_accept(sel)
+                        continue                # else: wakeup pipe
+                    # Contain per-client failures: one connection feeding
+                    # us garbage must not unwind the reactor and drop
+                    # every other client with it.
+                    try:
+                        if events & selectors.EVENT_READ:
+                            self._on_readable(sel, key.data)
+                        elif events & selectors.EVENT_WRITE:
+                            self._flush(sel, key.data)
+                    except Exception as e:
+                        self.device._log(
+                            "sys", f"Client {key.data.addr} error: {e!r}")
+                        self._close_client(sel, key.data)
+        finally:
+            for client in list(self._clients.values()):
+                self._close_client(sel, client)
+            sel.close()
+            for s in (self._server_sock, self._wakeup_r, self._wakeup_w):
+                try:
+                    s.close()
+                except OSError:
+                    pass
             self._server_sock = None
-
-        with self._state_lock:
-            socks = list(self._client_socks)
-            self._client_socks.clear()
+            self._wakeup_r = self._wakeup_w = None
             self._list_owner_conn = None
+            self.client_count = 0
 
-        for conn in socks:
-            try:
-                conn.shutdown(socket.SHUT_RDWR)
-            except OSError:
-                pass
-            try:
-                conn.close()
-            except OSError:
-                pass
-
-        self.client_count = 0
+    def _on_accept(self, sel):
+        try:
+            conn, addr = self._server_sock.accept()
+        except OSError:
+            return
+        # Short query/reply traffic: disable Nagle so each response
+        # leaves immediately instead of waiting to coalesce.  A 64 KB
+        # send buffer lets a full 1002-point LIST query response leave
+        # in one burst without the reactor parking on EVENT_WRITE.
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        except OSError:
+            pass
+        conn.setblocking(False)
+        client = _Client(conn, addr)
+        self._clients[conn] = client
+        self.client_count = len(self._clients)
+        sel.register(conn, selectors.EVENT_READ, client)
+        self.device._log("sys", f"Client connected: {addr}")
+
+    def _on_readable(self, sel, client):
+        try:
+            n = client.conn.recv_into(self._rx_mv)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_client(sel, client)
+            return
+        if n == 0:
+            self._close_client(sel, client)
+            return
+        buf = client.buf
+        buf.extend(self._rx_mv[:n])
+
+        # Carve off every complete line in one pass; the scan offset
+        # means an unterminated line is never re-scanned from the start
+        # on each recv.
+        last_nl = buf.rfind(b"\n", client.scan_from)
+        if last_nl < 0:
+            client.scan_from = len(buf)
+            if client.scan_from > MAX_RX_LINE_BYTES:
+                self.device._push_error(-223, "Too much data")
+                self.device._log(
+                    "sys", "Dropped oversized unterminated input line")
+                buf.clear()
+                client.scan_from = 0
+            return
+        lines = bytes(buf[:last_nl]).split(b"\n")
+        del buf[:last_nl + 1]
+        client.scan_from = 0
+
+        # Collect every echo and response for this recv batch, then push
+        # them with one send: a pipelined burst costs one syscall, not
+        # two per command.
+        out = bytearray()
+        for line in lines:
+            if len(line) > MAX_RX_LINE_BYTES:
+                self.device._push_error(-223, "Too much data")
+                self.device._log("sys", "Dropped oversized input line")
+                continue
+            raw = line.strip()
+            if not raw:
+                continue
+            # Echo the command back (Telnet echo emulation) — raw bytes,
+            # no decode/encode round trip.
+            if self.echo:
+                out += raw + b"\r\n"
+            entry = self._line_cache.get(raw)
+            if entry is None:
+                if len(self._line_cache) >= 256:
+                    self._line_cache.clear()
+                cmd = raw.decode("ascii", errors="replace")
+                cmd_upper = sys.intern(cmd.upper())
+                # A run may arrive chained ("LIST:COUN 1;:OUTP ON;:
+                # VOLT:MODE LIST"), so the owner check has to look at
+                # each ;-segment, not just the whole line.
+                starts_list = cmd_upper in _LIST_START_CMDS or (
+                    ";" in cmd_upper
+                    and not _LIST_START_CMDS.isdisjoint(
+                        seg.strip().lstrip(":")
+                        for seg in cmd_upper.split(";")))
+                entry = self._line_cache[raw] = (cmd, starts_list)
+            cmd, starts_list = entry
+            if starts_list:
+                self._list_owner_conn = client.conn
+            resp = self.device.process_raw(cmd)
+            if resp is not None:
+                out += resp
+        if out:
+            self._send(sel, client, out)
+
+    def _send(self, sel, client, data):
+        if client.out:
+            # Already waiting for EVENT_WRITE; keep ordering.
+            client.out.extend(data)
+            return
+        try:
+            sent = client.conn.send(data)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._close_client(sel, client)
+            return
+        if sent < len(data):
+            client.out.extend(data[sent:])
+            sel.modify(client.conn,
+                       selectors.EVENT_READ | selectors.EVENT_WRITE, client)
 
-        if self._accept_thread and self._accept_thread.is_alive():
-            self._accept_thread.join(timeout=1.5)
-        self._accept_thread = None
+    def _flush(self, sel, client):
+        try:
+            sent = client.conn.send(client.out)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_client(sel, client)
+            return
+        del client.out[:sent]
+        if not client.out:
+            sel.modify(client.conn, selectors.EVENT_READ, client)
 
-    def _accept_loop(self):
-        while self._running:
-            try:
-                conn, addr = self._server_sock.accept()
-            except socket.timeout:
-                continue
-            except OSError:
-                break
-            with self._state_lock:
-                self._client_socks.add(conn)
-                self.client_count = len(self._client_socks)
-            self.device._log("sys", f"Client connected: {addr}")
-            t = threading.Thread(target=self._client_handler,
-                                 args=(conn, addr), daemon=True)
-            t.start()
-            self._clients.append(t)
-
-    def _client_handler(self, conn: socket.socket, addr):
-        buf = bytearray()
+    def _close_client(self, sel, client):
         try:
-            conn.settimeout(0.5)
-            while self._running:
-                try:
-                    data = conn.recv(1024)
-                except socket.timeout:
-                    continue
-                except OSError:
-                    break
-                if not data:
-                    break
-                buf.extend(data)
-
-                if len(buf) > MAX_RX_LINE_BYTES and b"\n" not in buf:
-                    self.device._push_error(-223, "Too much data")
-                    self.device._log("sys", "Dropped oversized unterminated input line")
-                    buf.clear()
-                    continue
-
-                while True:
-                    nl = buf.find(b"\n")
-                    if nl < 0:
-                        break
-                    line = bytes(buf[:nl])
-                    del buf[:nl + 1]
-                    cmd = line.decode("ascii", errors="replace").strip()
-                    if not cmd:
-                        continue
-                    # Echo the command back (Telnet echo emulation)
-                    if self.echo:
-                        try:
-                            conn.sendall((cmd + "\r\n").encode("ascii"))
-                        except OSError:
-                            break
-                    cmd_upper = cmd.upper()
-                    if cmd_upper in ("VOLT:MODE LIST", "CURR:MODE LIST"):
-                        with self._state_lock:
-                            self._list_owner_conn = conn
-                    resp = self.device.process(cmd)
-                    if resp is not None:
-                        conn.sendall((resp + "\n").encode("ascii"))
-        finally:
-            should_stop = False
-            with self._state_lock:
-                if self._list_owner_conn is conn:
-                    self._list_owner_conn = None
-                    should_stop = True
-                self._client_socks.discard(conn)
-                self.client_count = len(self._client_socks)
-            if should_stop:
-                self.device._stop_list()
-            self.device._log("sys", f"Client disconnected: {addr}")
-            try:
-                conn.close()
-            except OSError:
-                pass
+            sel.unregister(client.conn)
+        except (KeyError, ValueError):
+            pass
+        self._clients.pop(client.conn, None)
+        self.client_count = len(self._clients)
+        if self._list_owner_conn is client.conn:
+            self._list_owner_conn = None
+            self.device._stop_list()
+        self.device._log("sys", f"Client disconnected: {client.addr}")
+        try:
+            client.conn.close()
+        except OSError:
+            pass
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -943,13 +1396,22 @@ class SimulatorGUI:
     def __init__(self, telnet_port: int, socket_port: int):
         self.telnet_port = telnet_port
         self.socket_port = socket_port
-        self.log_queue: _queue.Queue = _queue.Queue()
-        self._refresh_pending = False
-        self._refresh_guard = threading.Lock()
+        # Bounded deque: append/popleft are GIL-atomic and maxlen drops
+        # the oldest entry on overflow, so the producer side needs no
+        # lock round-trip or drain loop per message.
+        self.log_queue: collections.deque = collections.deque(
+            maxlen=self.MAX_LOG_QUEUE)
+        # Plain bool, no Event: a GIL-atomic attribute store is all a
+        # mutation needs, and the Tk tick check-and-clears it.
+        self._dirty = False
+        self._var_prev: dict[str, str] = {}
+        self._list_box_key = None
+        self._dwel_box_key = None
+        self._log_box_lines = 0
 
         # device + server
         self.device = KepcoDevice(
-            on_state_change=self._schedule_refresh,
+            on_state_change=self._mark_dirty,
             on_log=self._enqueue_log,
         )
         self.servers = [
@@ -972,6 +1434,7 @@ class SimulatorGUI:
         for srv in self.servers:
             srv.start()
         self._refresh_state()
+        self._refresh_tick()
         self._poll_log()
 
     # ── build UI ──────────────────────────────────────────────────────────
@@ -986,12 +1449,14 @@ class SimulatorGUI:
                      f"SOCKET 0.0.0.0:{self.socket_port}",
                      font=ctk.CTkFont(size=15, weight="bold"),
                      text_color="white").pack(side="left", padx=8)
+        self.client_var = tk.StringVar(value="Clients: 0")
         self.client_lbl = ctk.CTkLabel(
-            top, text="Clients: 0", text_color="white",
+            top, textvariable=self.client_var, text_color="white",
             font=ctk.CTkFont(size=12))
         self.client_lbl.pack(side="right", padx=14)
+        self.cmd_var = tk.StringVar(value="Cmds: 0  Queries: 0")
         self.cmd_lbl = ctk.CTkLabel(
-            top, text="Cmds: 0  Queries: 0", text_color="white",
+            top, textvariable=self.cmd_var, text_color="white",
             font=ctk.CTkFont(size=12))
         self.cmd_lbl.pack(side="right", padx=14)
 
@@ -1112,6 +1577,7 @@ class SimulatorGUI:
         grid.pack(fill="x", padx=12, pady=(0, 10))
 
         self._out_labels = {}
+        self._out_vars = {}
         fields = [
             ("Output",      "output_on"),
             ("FUNC:MODE",   "func_mode"),
@@ -1132,13 +1598,15 @@ class SimulatorGUI:
                          font=ctk.CTkFont(size=11),
                          width=90, anchor="e").grid(
                 row=r, column=c * 2, padx=(0, 2), pady=1, sticky="e")
-            lbl = ctk.CTkLabel(grid, text="—", text_color=C["text"],
+            var = tk.StringVar(value="—")
+            lbl = ctk.CTkLabel(grid, textvariable=var, text_color=C["text"],
                                font=ctk.CTkFont(family="Consolas", size=12,
                                                  weight="bold"),
                                width=110, anchor="w")
             lbl.grid(row=r, column=c * 2 + 1, padx=(0, 12), pady=1,
                      sticky="w")
             self._out_labels[key] = lbl
+            self._out_vars[key] = var
 
     # ── LIST registers panel ──────────────────────────────────────────────
     def _build_list_panel(self, parent):
@@ -1153,6 +1621,7 @@ class SimulatorGUI:
         grid.pack(fill="x", padx=12, pady=(0, 4))
 
         self._list_labels = {}
+        self._list_vars = {}
         meta_fields = [
             ("LIST:COUN",   "list_count"),
             ("LIST:DIR",    "list_dir"),
@@ -1173,13 +1642,15 @@ class SimulatorGUI:
                          font=ctk.CTkFont(size=11),
                          width=80, anchor="e").grid(
                 row=r, column=c * 2, padx=(0, 2), pady=1, sticky="e")
-            lbl = ctk.CTkLabel(grid, text="—", text_color=C["text"],
+            var = tk.StringVar(value="—")
+            lbl = ctk.CTkLabel(grid, textvariable=var, text_color=C["text"],
                                font=ctk.CTkFont(family="Consolas", size=12,
                                                  weight="bold"),
                                width=100, anchor="w")
             lbl.grid(row=r, column=c * 2 + 1, padx=(0, 10), pady=1,
                      sticky="w")
             self._list_labels[key] = lbl
+            self._list_vars[key] = var
 
         # data tables: VOLT + DWEL
         ctk.CTkLabel(frm, text="LIST:VOLT / LIST:CURR data (first 50 shown)",
@@ -1216,6 +1687,7 @@ class SimulatorGUI:
         grid.pack(fill="x", padx=12, pady=(0, 10))
 
         self._stat_labels = {}
+        self._stat_vars = {}
         stat_fields = [
             ("ESR",         "esr"),
             ("STB",         "stb"),
@@ -1233,170 +1705,227 @@ class SimulatorGUI:
                          font=ctk.CTkFont(size=11),
                          width=80, anchor="e").grid(
                 row=r, column=c * 2, padx=(0, 2), pady=1, sticky="e")
-            lbl = ctk.CTkLabel(grid, text="—", text_color=C["text"],
+            var = tk.StringVar(value="—")
+            lbl = ctk.CTkLabel(grid, textvariable=var, text_color=C["text"],
                                font=ctk.CTkFont(family="Consolas", size=12,
                                                  weight="bold"),
                                width=100, anchor="w")
             lbl.grid(row=r, column=c * 2 + 1, padx=(0, 10), pady=1,
                      sticky="w")
             self._stat_labels[key] = lbl
+            self._stat_vars[key] = var
 
     # ── refresh display ───────────────────────────────────────────────────
-    def _schedule_refresh(self):
-        with self._refresh_guard:
-            if self._refresh_pending:
-                return
-            self._refresh_pending = True
-        try:
-            self.root.after(0, self._refresh_state)
-        except Exception:
-            with self._refresh_guard:
-                self._refresh_pending = False
+    def _mark_dirty(self):
+        self._dirty = True
+
+    def _refresh_tick(self):
+        """30 Hz coalescing timer: device threads only set the dirty
+        flag, so a kHz command stream costs one redraw per frame instead
+        of one scheduled callback per command."""
+        if self._dirty:
+            self._dirty = False
+            self._refresh_state()
+        self.root.after(33, self._refresh_tick)
+
+    def _set(self, var, text):
+        """Write a label StringVar only when the text actually changed.
+
+        The shadow dict (keyed by Tcl variable name — tk.Variable is
+        unhashable) makes the no-change case a pure-Python dict hit with
+        no round trip into Tcl.  Returns True when the value was written
+        so callers can piggyback colour changes on it.
+        """
+        name = str(var)
+        if self._var_prev.get(name) == text:
+            return False
+        self._var_prev[name] = text
+        var.set(text)
+        return True
 
     def _refresh_state(self):
-        with self._refresh_guard:
-            self._refresh_pending = False
         d = self.device
+        # Copy everything the render needs while holding the lock, then
+        # paint with the lock released — each configure() marshals into
+        # Tcl, and SCPI threads should not stall behind that.
         with d._lock:
-            # output panel
-            self._out_labels["output_on"].configure(
-                text="ON" if d.output_on else "OFF",
-                text_color=C["green"] if d.output_on else C["red"])
-            self._out_labels["func_mode"].configure(text=d.func_mode)
-            self._out_labels["volt_setpoint"].configure(
-                text=f"{d.volt_setpoint:.4f} V")
-            self._out_labels["curr_setpoint"].configure(
-                text=f"{d.curr_setpoint:.4f} A")
-            self._out_labels["volt_mode"].configure(text=d.volt_mode)
-            self._out_labels["curr_mode"].configure(text=d.curr_mode)
-            self._out_labels["volt_range"].configure(
-                text="Full" if d.volt_range == 1 else "Quarter")
-            self._out_labels["curr_range"].configure(
-                text="Full" if d.curr_range == 1 else "Quarter")
-            self._out_labels["volt_range_auto"].configure(
-                text="ON" if d.volt_range_auto else "OFF")
-            self._out_labels["curr_range_auto"].configure(
-                text="ON" if d.curr_range_auto else "OFF")
-
-            # LIST meta
-            self._list_labels["list_count"].configure(
-                text=str(d.list_count))
-            self._list_labels["list_dir"].configure(text=d.list_dir)
-            self._list_labels["list_gen"].configure(text=d.list_gen)
-            self._list_labels["list_count_skip"].configure(
-                text=str(d.list_count_skip))
-            self._list_labels["list_running"].configure(
-                text="▶ RUNNING" if d.list_running else "⏹ STOPPED",
-                text_color=C["green"] if d.list_running else C["text2"])
-            self._list_labels["list_step_idx"].configure(
-                text=str(d.list_step_idx))
-            self._list_labels["list_iteration"].configure(
-                text=str(d.list_iteration))
-            self._list_labels["list_query_ptr"].configure(
-                text=str(d.list_query_ptr))
-            self._list_labels["list_volt_pts"].configure(
-                text=str(len(d.list_volt)))
-            self._list_labels["list_curr_pts"].configure(
-                text=str(len(d.list_curr)))
-            self._list_labels["list_dwel_pts"].configure(
-                text=str(len(d.list_dwel)))
-            self._list_labels["list_seq_pts"].configure(
-                text=str(len(d.list_seq)))
-
-            # LIST data
-            data = d.list_volt or d.list_curr
-            data_label = "VOLT" if d.list_volt else "CURR"
-            data_preview = data[:50]
-            dwel_preview = d.list_dwel[:50]
-
-            # status
-            self._stat_labels["esr"].configure(text=str(d.esr))
-            self._stat_labels["stb"].configure(text=str(d.stb))
-            self._stat_labels["oper_cond"].configure(
-                text=str(d.oper_cond))
-            self._stat_labels["oper_enable"].configure(
-                text=str(d.oper_enable))
-            self._stat_labels["oper_event"].configure(
-                text=str(d.oper_event))
-            self._stat_labels["ques_cond"].configure(
-                text=str(d.ques_cond))
-            self._stat_labels["ques_enable"].configure(
-                text=str(d.ques_enable))
-            self._stat_labels["ques_event"].configure(
-                text=str(d.ques_event))
-            self._stat_labels["error_count"].configure(
-                text=str(len(d.error_queue)))
-
+            output_on = d.output_on
+            func_mode = d.func_mode
+            volt_setpoint = d.volt_setpoint
+            curr_setpoint = d.curr_setpoint
+            volt_mode = d.volt_mode
+            curr_mode = d.curr_mode
+            volt_range = d.volt_range
+            curr_range = d.curr_range
+            volt_range_auto = d.volt_range_auto
+            curr_range_auto = d.curr_range_auto
+
+            list_count = d.list_count
+            list_dir = d.list_dir
+            list_gen = d.list_gen
+            list_count_skip = d.list_count_skip
+            list_running = d.list_running
+            list_step_idx = d.list_step_idx
+            list_iteration = d.list_iteration
+            list_query_ptr = d.list_query_ptr
+            list_volt_n = d.list_volt_n
+            list_curr_n = d.list_curr_n
+            dwel_n = d.list_dwel_n
+            list_seq_n = len(d.list_seq)
+
+            if list_volt_n:
+                data_n = list_volt_n
+                data_label = "VOLT"
+                data_preview = d.list_volt[:min(50, data_n)].tolist()
+            else:
+                data_n = list_curr_n
+                data_label = "CURR"
+                data_preview = d.list_curr[:min(50, data_n)].tolist()
+            dwel_preview = d.list_dwel[:min(50, dwel_n)].tolist()
+
+            esr = d.esr
+            stb = d.stb
+            oper_cond = d.oper_cond
+            oper_enable = d.oper_enable
+            oper_event = d.oper_event
+            ques_cond = d.ques_cond
+            ques_enable = d.ques_enable
+            ques_event = d.ques_event
+            error_count = len(d.error_queue)
             cmd_cnt = d.cmd_count
             q_cnt = d.query_count
 
-        # measurements (unlocked — they acquire their own lock)
+        # output panel
+        _set = self._set
+        out_vars = self._out_vars
+        if _set(out_vars["output_on"], "ON" if output_on else "OFF"):
+            self._out_labels["output_on"].configure(
+                text_color=C["green"] if output_on else C["red"])
+        _set(out_vars["func_mode"], func_mode)
+        _set(out_vars["volt_setpoint"], f"{volt_setpoint:.4f} V")
+        _set(out_vars["curr_setpoint"], f"{curr_setpoint:.4f} A")
+        _set(out_vars["volt_mode"], volt_mode)
+        _set(out_vars["curr_mode"], curr_mode)
+        _set(out_vars["volt_range"], "Full" if volt_range == 1 else "Quarter")
+        _set(out_vars["curr_range"], "Full" if curr_range == 1 else "Quarter")
+        _set(out_vars["volt_range_auto"], "ON" if volt_range_auto else "OFF")
+        _set(out_vars["curr_range_auto"], "ON" if curr_range_auto else "OFF")
+
+        # LIST meta
+        list_vars = self._list_vars
+        _set(list_vars["list_count"], str(list_count))
+        _set(list_vars["list_dir"], list_dir)
+        _set(list_vars["list_gen"], list_gen)
+        _set(list_vars["list_count_skip"], str(list_count_skip))
+        if _set(list_vars["list_running"],
+                "▶ RUNNING" if list_running else "⏹ STOPPED"):
+            self._list_labels["list_running"].configure(
+                text_color=C["green"] if list_running else C["text2"])
+        _set(list_vars["list_step_idx"], str(list_step_idx))
+        _set(list_vars["list_iteration"], str(list_iteration))
+        _set(list_vars["list_query_ptr"], str(list_query_ptr))
+        _set(list_vars["list_volt_pts"], str(list_volt_n))
+        _set(list_vars["list_curr_pts"], str(list_curr_n))
+        _set(list_vars["list_dwel_pts"], str(dwel_n))
+        _set(list_vars["list_seq_pts"], str(list_seq_n))
+
+        # status
+        stat_vars = self._stat_vars
+        _set(stat_vars["esr"], str(esr))
+        _set(stat_vars["stb"], str(stb))
+        _set(stat_vars["oper_cond"], str(oper_cond))
+        _set(stat_vars["oper_enable"], str(oper_enable))
+        _set(stat_vars["oper_event"], str(oper_event))
+        _set(stat_vars["ques_cond"], str(ques_cond))
+        _set(stat_vars["ques_enable"], str(ques_enable))
+        _set(stat_vars["ques_event"], str(ques_event))
+        _set(stat_vars["error_count"], str(error_count))
+
+        # measurements (lock-free snapshot readers)
         mv = d.measure_volt()
         mc = d.measure_curr()
-        self._out_labels["meas_volt"].configure(
-            text=f"{mv:.4f} V")
-        self._out_labels["meas_curr"].configure(
-            text=f"{mc:.4f} A")
+        _set(out_vars["meas_volt"], f"{mv:.4f} V")
+        _set(out_vars["meas_curr"], f"{mc:.4f} A")
 
         # top bar counters
-        self.cmd_lbl.configure(
-            text=f"Cmds: {cmd_cnt}  Queries: {q_cnt}")
+        _set(self.cmd_var, f"Cmds: {cmd_cnt}  Queries: {q_cnt}")
         total_clients = sum(srv.client_count for srv in self.servers)
-        self.client_lbl.configure(
-            text=f"Clients: {total_clients}")
-
-        # list data textboxes
-        self.list_data_box.configure(state="normal")
-        self.list_data_box.delete("1.0", "end")
-        if data_preview:
-            self.list_data_box.insert("1.0",
-                f"[{data_label}] {len(data)} pts: " +
-                ", ".join(f"{v:.3f}" for v in data_preview) +
-                ("  ..." if len(data) > 50 else ""))
-        else:
-            self.list_data_box.insert("1.0", "(empty)")
-        self.list_data_box.configure(state="disabled")
-
-        self.list_dwel_box.configure(state="normal")
-        self.list_dwel_box.delete("1.0", "end")
-        if dwel_preview:
-            self.list_dwel_box.insert("1.0",
-                f"[DWEL] {len(d.list_dwel)} pts: " +
-                ", ".join(f"{v:.6f}" for v in dwel_preview) +
-                ("  ..." if len(d.list_dwel) > 50 else ""))
-        else:
-            self.list_dwel_box.insert("1.0", "(empty)")
-        self.list_dwel_box.configure(state="disabled")
+        _set(self.client_var, f"Clients: {total_clients}")
+
+        # list data textboxes: deleting and re-inserting Tcl text every
+        # tick is the most expensive part of the repaint, so each box is
+        # only touched when its preview actually changed.
+        data_key = (data_label, data_n, hash(tuple(data_preview)))
+        if data_key != self._list_box_key:
+            self._list_box_key = data_key
+            self.list_data_box.configure(state="normal")
+            self.list_data_box.delete("1.0", "end")
+            if data_preview:
+                self.list_data_box.insert("1.0",
+                    f"[{data_label}] {data_n} pts: " +
+                    ", ".join(map("{:.3f}".format, data_preview)) +
+                    ("  ..." if data_n > 50 else ""))
+            else:
+                self.list_data_box.insert("1.0", "(empty)")
+            self.list_data_box.configure(state="disabled")
+
+        dwel_key = (dwel_n, hash(tuple(dwel_preview)))
+        if dwel_key != self._dwel_box_key:
+            self._dwel_box_key = dwel_key
+            self.list_dwel_box.configure(state="normal")
+            self.list_dwel_box.delete("1.0", "end")
+            if dwel_preview:
+                self.list_dwel_box.insert("1.0",
+                    f"[DWEL] {dwel_n} pts: " +
+                    ", ".join(map("{:.6f}".format, dwel_preview)) +
+                    ("  ..." if dwel_n > 50 else ""))
+            else:
+                self.list_dwel_box.insert("1.0", "(empty)")
+            self.list_dwel_box.configure(state="disabled")
 
     # ── log handling ──────────────────────────────────────────────────────
+    _LOG_MARK = {"rx": "▶", "tx": "◀"}
+    _log_ts_sec = 0
+    _log_ts_str = ""
+
     def _enqueue_log(self, direction, text):
-        ts = time.strftime("%H:%M:%S")
-        while self.log_queue.qsize() >= self.MAX_LOG_QUEUE:
-            try:
-                self.log_queue.get_nowait()
-            except _queue.Empty:
-                break
-        if direction == "rx":
-            self.log_queue.put(f"[{ts}] ▶ {text}\n")
-        elif direction == "tx":
-            self.log_queue.put(f"[{ts}] ◀ {text}\n")
-        else:
-            self.log_queue.put(f"[{ts}] ● {text}\n")
+        # Producer side stays a bare append: timestamp formatting runs
+        # on the Tk consumer thread, off the SCPI hot path.
+        self.log_queue.append((time.time(), direction, text))
 
     def _poll_log(self):
+        # Drain with popleft(): deque ends are independently thread-safe,
+        # so nothing a reactor thread appends mid-drain is lost (a
+        # snapshot-then-clear would silently drop it).
+        q = self.log_queue
         batch = []
-        try:
-            while True:
-                batch.append(self.log_queue.get_nowait())
-        except _queue.Empty:
-            pass
+        while q:
+            batch.append(q.popleft())
         if batch:
-            self.log_box.insert("end", "".join(batch))
+            # strftime is a libc/locale call; at 1 s display resolution
+            # one call per second covers an entire burst.
+            mark = self._LOG_MARK.get
+            last_sec = self._log_ts_sec
+            ts = self._log_ts_str
+            parts = []
+            for t, direction, text in batch:
+                sec = int(t)
+                if sec != last_sec:
+                    last_sec = sec
+                    ts = time.strftime("%H:%M:%S", time.localtime(sec))
+                parts.append(f"[{ts}] {mark(direction, '●')} {text}\n")
+            self._log_ts_sec = last_sec
+            self._log_ts_str = ts
+            self.log_box.insert("end", "".join(parts))
             self.log_box.see("end")
-            # trim
-            lines = int(self.log_box.index("end-1c").split(".")[0])
-            if lines > self.MAX_LOG_LINES:
-                self.log_box.delete("1.0", f"{lines - self.MAX_LOG_LINES}.0")
+            # Trim with client-side bookkeeping: each entry is exactly
+            # one line, so counting them here avoids the index("end-1c")
+            # round trip into Tcl every tick.
+            self._log_box_lines += len(parts)
+            excess = self._log_box_lines - self.MAX_LOG_LINES
+            if excess > 0:
+                self.log_box.delete("1.0", f"{excess + 1}.0")
+                self._log_box_lines = self.MAX_LOG_LINES
         self.root.after(100, self._poll_log)
 
     # ── actions ───────────────────────────────────────────────────────────
@@ -1405,6 +1934,7 @@ class SimulatorGUI:
 
     def _clear_log(self):
         self.log_box.delete("1.0", "end")
+        self._log_box_lines = 0
 
     def _run_manual_command(self):
         cmd = self.manual_cmd_entry.get().strip()
@@ -12,9 +12,14 @@ Hardware Constraints (BIT 802E manual):
   - Use VOLT:RANG 1 / CURR:RANG 1 to avoid quarter-scale transients
 """
 
+import errno
+import functools
+import io
 import socket
-import math
-import csv
+import selectors
+import struct
+import os
+import numpy as np
 import threading
 import time
 import ipaddress
@@ -26,9 +31,10 @@ import customtkinter as ctk
 
 import matplotlib
 matplotlib.use("TkAgg")
-import matplotlib.lines as mlines
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 
 # ── Constants ───────────────────────────────────────────────────────────────
 MIN_DWELL        = 0.0005    # 500 µs – hardware minimum
@@ -38,10 +44,12 @@ MAX_TOTAL_POINTS = 4000      # 4 × 1000 chunks
 TELNET_PORT      = 5024      # manual 2.4.2 / 4.5: Telnet first
 SCPI_SOCKET_PORT = 5025      # alternate direct socket endpoint
 DISCOVERY_TIMEOUT = 0.25
+DISCOVERY_MAX_INFLIGHT = 64  # concurrent probe sockets (2 per host)
 CHUNK_CMD_LIMIT  = 200       # safe margin for 253-byte SCPI buffer
 SCPI_CMD_GAP     = 0.035     # > 25ms spec throughput (PAR 1.2.2)
 LIST_VALUES_PER_CMD = 10     # manual examples show max 11 (PAR B.45/B.31)
 RECV_TIMEOUT     = 3.0       # socket recv timeout for queries
+ECHO_DRAIN_EVERY = 16        # commands between lazy Telnet-echo sweeps
 
 # ── Material colour palette ─────────────────────────────────────────────────
 C = dict(
@@ -85,6 +93,10 @@ class KepcoController:
         self.connected = False
         self.last_error = ""
         self._lock = threading.Lock()
+        self._next_send_time = 0.0    # monotonic; earliest next send
+        self._need_iac_strip = True   # Telnet transport until told otherwise
+        self._echo_pending = 0        # commands since the last echo sweep
+        self._cur_timeout = None      # mirrors sock.gettimeout()
 
     # ── connect / disconnect ───────────────────────────────────────────────
     def connect(self, ip, port=None):
@@ -97,7 +109,23 @@ class KepcoController:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             try:
                 s.settimeout(5)
+                # Room for echoes to accumulate between lazy drains
+                # (set before connect so the window is negotiated large)
+                try:
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+                    # ...and the send side too, so pipelined list
+                    # uploads queue whole windows without blocking
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+                except OSError:
+                    pass
                 s.connect((ip, target_port))
+                # Short command/response traffic: disable Nagle so each
+                # command leaves immediately instead of waiting up to
+                # 40 ms for the previous ACK.
+                try:
+                    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
                 # Drain Telnet IAC negotiation the card sends on connect
                 time.sleep(0.1)
                 s.setblocking(False)
@@ -107,11 +135,13 @@ class KepcoController:
                     pass
                 s.setblocking(True)
                 s.settimeout(RECV_TIMEOUT)
+                self._cur_timeout = RECV_TIMEOUT
 
                 self.sock = s
                 self.ip = ip
                 self.port = target_port
                 self.transport = transport
+                self._need_iac_strip = (target_port == TELNET_PORT)
                 self.connected = True
                 self.last_error = ""
                 return True, f"Connected via {transport} ({target_port})"
@@ -125,6 +155,34 @@ class KepcoController:
         self.last_error = last_err
         return False, last_err
 
+    def adopt(self, sock, ip, port):
+        """Take over a live, already-verified socket from discovery.
+
+        The scanner completed the handshake and saw an *IDN? reply on
+        this socket, so "Connect" after a scan skips a fresh TCP
+        handshake (and Telnet negotiation) entirely.  Falls back to the
+        caller on failure — the socket may have died while idle.
+        """
+        self.disconnect()
+        try:
+            sock.setblocking(True)
+            sock.settimeout(RECV_TIMEOUT)
+        except OSError as e:
+            try:
+                sock.close()
+            except OSError:
+                pass
+            return False, str(e)
+        self._cur_timeout = RECV_TIMEOUT
+        self.sock = sock
+        self.ip = ip
+        self.port = port
+        self.transport = "TELNET" if port == TELNET_PORT else "SOCKET"
+        self._need_iac_strip = (port == TELNET_PORT)
+        self.connected = True
+        self.last_error = ""
+        return True, f"Connected via {self.transport} ({port}, adopted)"
+
     def disconnect(self):
         if self.sock:
             try:
@@ -143,16 +201,24 @@ class KepcoController:
     # ── Telnet IAC filtering ──────────────────────────────────────────────
     @staticmethod
     def _strip_iac(data: bytes) -> bytes:
-        """Remove Telnet IAC (0xFF) negotiation sequences from raw bytes."""
+        """Remove Telnet IAC (0xFF) negotiation sequences from raw bytes.
+
+        Output is written through a cursor into a preallocated bytearray
+        (stripping only ever shrinks the data) instead of growing one
+        with per-byte appends.  Callers guard with ``0xFF in data`` so
+        the clean-path cost is a single C-level scan.
+        """
         if 0xFF not in data:
             return data
-        out = bytearray()
-        i = 0
+        mv = memoryview(data)
         n = len(data)
+        out = bytearray(n)
+        w = 0
+        i = 0
         while i < n:
-            b = data[i]
+            b = mv[i]
             if b == 0xFF and i + 1 < n:
-                nxt = data[i + 1]
+                nxt = mv[i + 1]
                 if nxt in (0xFB, 0xFC, 0xFD, 0xFE):   # WILL/WONT/DO/DONT
                     i += 3
                     continue
@@ -161,41 +227,57 @@ class KepcoController:
                     i = (end + 2) if end >= 0 else (i + 2)
                     continue
                 elif nxt == 0xFF:                        # escaped 0xFF
-                    out.append(0xFF)
+                    out[w] = 0xFF
+                    w += 1
                     i += 2
                     continue
                 else:
                     i += 2
                     continue
-            out.append(b)
+            out[w] = b
+            w += 1
             i += 1
-        return bytes(out)
+        return bytes(out[:w])
 
     # ── socket helpers ─────────────────────────────────────────────────────
     def _drain_echo(self):
-        """Quick non-blocking drain of Telnet echo after every send_cmd.
+        """Non-blocking sweep of accumulated Telnet echoes.
 
         The BIT 802E Telnet server echoes every command back verbatim.
         If these echo bytes are never read they accumulate in the card's
-        tiny TCP send buffer (~253 bytes, PAR B.2).  When that buffer
-        fills the card blocks trying to echo and can no longer read new
-        commands → deadlock / freeze.
-
-        This is intentionally very short — just long enough to pick up
-        a single echo line that is already in-flight.
+        tiny TCP send buffer (~253 bytes, PAR B.2); once the host stops
+        ACKing, the card blocks trying to echo and can no longer read
+        new commands → deadlock / freeze.
+
+        The host's 64 KB SO_RCVBUF keeps the receive window open across
+        many echoes, so this runs lazily — every ECHO_DRAIN_EVERY
+        commands rather than after each one — and pulls only what is
+        already buffered instead of sleeping 20 ms per command waiting
+        for the echo to arrive.
         """
-        prev = self.sock.gettimeout()
         try:
-            self.sock.settimeout(0.02)          # 20 ms
-            try:
-                self.sock.recv(1024)
-            except (socket.timeout, OSError):
-                pass
+            self._set_timeout(0)                # poll, never wait
+            while True:
+                try:
+                    if not self.sock.recv(4096):
+                        break
+                except (BlockingIOError, socket.timeout, OSError):
+                    break
         finally:
-            try:
-                self.sock.settimeout(prev)
-            except Exception:
-                pass
+            self._echo_pending = 0
+
+    def _set_timeout(self, t):
+        """settimeout only when the cached value differs.
+
+        Every I/O helper used to save/restore the socket timeout around
+        itself; tracking the current value lets the common repeated
+        calls (same timeout as last time) skip the socket call — and
+        the blocking↔non-blocking fcntl underneath it — entirely.  The
+        next helper sets what it needs, so nothing restores.
+        """
+        if t != self._cur_timeout:
+            self.sock.settimeout(t)
+            self._cur_timeout = t
 
     def _drain_stale(self):
         """Drain all stale data (accumulated echoes) from the socket.
@@ -203,9 +285,8 @@ class KepcoController:
         Uses a short timeout so we wait long enough for any in-flight
         bytes to arrive but don't block indefinitely.
         """
-        prev = self.sock.gettimeout()
         try:
-            self.sock.settimeout(0.05)          # 50 ms
+            self._set_timeout(0.05)             # 50 ms
             while True:
                 try:
                     data = self.sock.recv(4096)
@@ -218,10 +299,7 @@ class KepcoController:
         except Exception:
             pass
         finally:
-            try:
-                self.sock.settimeout(prev)
-            except Exception:
-                pass
+            self._echo_pending = 0
 
     def _recv_response(self, sent_cmd=None, timeout=None):
         """Receive one SCPI response line, skipping Telnet echo lines.
@@ -232,45 +310,57 @@ class KepcoController:
         """
         timeout = timeout or RECV_TIMEOUT
         echo = sent_cmd.strip() if sent_cmd else None
-        prev = self.sock.gettimeout()
-        self.sock.settimeout(timeout)
+        # One kernel-governed timeout for the whole read: the old loop
+        # recomputed the deadline and reset settimeout() on every
+        # iteration, turning each query into a chain of small syscalls.
+        self._set_timeout(timeout)
         try:
-            raw = b""
-            deadline = time.time() + timeout
-            while time.time() < deadline:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    break
-                self.sock.settimeout(min(remaining, timeout))
+            # Accumulate into one bytearray (amortized O(1) appends —
+            # bytes concatenation copies the whole buffer per recv) and
+            # keep a scan cursor so the newline search never re-walks
+            # bytes already known to be terminator-free.
+            buf = bytearray()
+            scan = 0
+            need_strip = self._need_iac_strip
+            while True:
                 try:
-                    chunk = self.sock.recv(512)
+                    chunk = self.sock.recv(4096)
                 except socket.timeout:
                     break
                 if not chunk:
                     raise ConnectionError("Connection closed by peer")
-                raw += chunk
-                # Strip Telnet IAC sequences then decode
-                clean = (self._strip_iac(raw)
-                         if self.port == TELNET_PORT else raw)
-                text = clean.decode("ascii", errors="ignore")
-                parts = text.replace("\r\n", "\n").replace(
-                    "\r", "\n").split("\n")
-                trailing = parts[-1]
-                complete = parts[:-1]
-                for line in complete:
-                    line = line.strip()
-                    if not line:
+                buf.extend(chunk)
+                nl = buf.find(b"\n", scan)
+                if nl < 0:
+                    scan = len(buf)
+                    if scan > 8192:
+                        break
+                    continue
+                pos = 0
+                while nl >= 0:
+                    line = bytes(buf[pos:nl])
+                    pos = nl + 1
+                    nl = buf.find(b"\n", pos)
+                    # Strip Telnet IAC sequences, drop \r in one pass
+                    if need_strip and 0xFF in line:
+                        line = self._strip_iac(line)
+                    text = line.translate(None, b"\r").decode(
+                        "ascii", errors="ignore").strip()
+                    if not text:
                         continue
-                    if echo and line == echo:
+                    if echo and text == echo:
                         continue          # discard echo
-                    return line
+                    return text
                 # Only echo / empty lines so far — keep the tail
-                raw = trailing.encode("ascii", errors="ignore")
-                if len(raw) > 8192:
-                    break
+                del buf[:pos]
+                scan = len(buf)
             # Timeout — check anything left in buffer
-            if raw:
-                text = raw.decode("ascii", errors="ignore").strip()
+            if buf:
+                leftover = bytes(buf)
+                if need_strip and 0xFF in leftover:
+                    leftover = self._strip_iac(leftover)
+                text = leftover.translate(None, b"\r").decode(
+                    "ascii", errors="ignore").strip()
                 if text and not (echo and text == echo):
                     return text
             return None
@@ -280,29 +370,66 @@ class KepcoController:
             return None
         except Exception:
             return None
-        finally:
-            try:
-                self.sock.settimeout(prev)
-            except Exception:
-                pass
+
+    def _pace(self):
+        """Wait out whatever remains of the inter-command gap.
+
+        Called with the lock held.  The gap deadline is stamped when the
+        previous send finished, so a caller arriving later than
+        SCPI_CMD_GAP pays nothing — previously every send_cmd slept the
+        full 35 ms inside the lock, serializing concurrent callers
+        (status polls vs. upload batches) on pure sleep.
+        """
+        delta = self._next_send_time - time.monotonic()
+        if delta > 0:
+            time.sleep(delta)
 
     # ── SCPI primitive: command (no response) ──────────────────────────────
     def send_cmd(self, cmd):
         """Send a non-query SCPI command with mandatory pacing.
 
-        The SCPI_CMD_GAP sleep is *inside* the lock so that concurrent
-        threads cannot send a second command faster than the 25 ms
-        throughput limit.  After the gap, we drain the Telnet echo to
-        prevent the card's TCP send-buffer from filling up (which would
-        deadlock the card).  Returns True / None.
+        Pacing is enforced by _pace() against a deadline stamped after
+        the previous send, so no two commands go out within SCPI_CMD_GAP
+        (the 25 ms throughput limit, PAR 1.2.2) but the lock is held
+        only for actual I/O.  The Telnet echo is drained after each send
+        to prevent the card's TCP send-buffer from filling up (which
+        would deadlock the card).  Returns True / None.
         """
         if not self.connected and not self._safe_reconnect():
             return None
         with self._lock:
             try:
+                self._pace()
+                self._set_timeout(RECV_TIMEOUT)
                 self.sock.sendall((cmd + "\n").encode("ascii"))
-                time.sleep(SCPI_CMD_GAP)
-                self._drain_echo()          # consume Telnet echo
+                self._echo_pending += 1
+                if self._echo_pending >= ECHO_DRAIN_EVERY:
+                    self._drain_echo()      # lazy echo sweep
+                self._next_send_time = time.monotonic() + SCPI_CMD_GAP
+                return True
+            except Exception as e:
+                self.last_error = str(e)
+                self.disconnect()
+                return None
+
+    def _send_cmd_bytes(self, data):
+        """send_cmd for pre-encoded, newline-terminated ASCII bytes.
+
+        Identical pacing / echo-drain protocol, minus the per-call
+        str→bytes conversion — the list upload sends ~100 pre-packed
+        lines per 1000-point chunk through here.
+        """
+        if not self.connected and not self._safe_reconnect():
+            return None
+        with self._lock:
+            try:
+                self._pace()
+                self._set_timeout(RECV_TIMEOUT)
+                self.sock.sendall(data)
+                self._echo_pending += 1
+                if self._echo_pending >= ECHO_DRAIN_EVERY:
+                    self._drain_echo()      # lazy echo sweep
+                self._next_send_time = time.monotonic() + SCPI_CMD_GAP
                 return True
             except Exception as e:
                 self.last_error = str(e)
@@ -321,8 +448,11 @@ class KepcoController:
             return None
         with self._lock:
             try:
+                self._pace()
                 self._drain_stale()
+                self._set_timeout(RECV_TIMEOUT)
                 self.sock.sendall((cmd + "\n").encode("ascii"))
+                self._next_send_time = time.monotonic() + SCPI_CMD_GAP
                 resp = self._recv_response(sent_cmd=cmd, timeout=timeout)
                 if resp is None:
                     self.last_error = f"No response to '{cmd}'"
@@ -350,25 +480,131 @@ class KepcoController:
         """
         return self.send_cmd("*WAI") is not None
 
+    @staticmethod
+    def _split_scpi_fields(resp):
+        """Split a compound SCPI response on ';' outside double quotes.
+
+        Error strings may themselves contain semicolons inside the
+        quoted message ('-221,\"Settings conflict; ...\"'), so a plain
+        str.split would shred them.
+        """
+        fields = []
+        start = 0
+        in_quote = False
+        for i, ch in enumerate(resp):
+            if ch == '"':
+                in_quote = not in_quote
+            elif ch == ';' and not in_quote:
+                fields.append(resp[start:i])
+                start = i + 1
+        fields.append(resp[start:])
+        return fields
+
     def drain_errors(self):
-        """Read and return all queued SYST:ERR entries (stops at '0,…')."""
+        """Read and return all queued SYST:ERR entries (stops at '0,…').
+
+        Five SYST:ERR? queries are chained per message (semicolon
+        compound, standard SCPI) so the common zero-error case costs one
+        round-trip instead of paying RTT + SCPI_CMD_GAP per entry.
+        """
         errors = []
-        for _ in range(20):
-            resp = self.send_query("SYST:ERR?")
+        compound = ";".join(["SYST:ERR?"] * 5)
+        for _ in range(4):                    # ≤ 20 entries, as before
+            resp = self.send_query(compound)
             if resp is None:
                 break
-            resp = resp.strip()
-            if resp.startswith("0") or "No error" in resp:
+            done = False
+            for entry in self._split_scpi_fields(resp):
+                entry = entry.strip()
+                if not entry:
+                    continue
+                if entry.startswith("0") or "No error" in entry:
+                    done = True
+                    break
+                errors.append(entry)
+            if done:
                 break
-            errors.append(resp)
         return errors
 
     def identity(self):
         return self.send_query("*IDN?")
 
+    # Fraction part of every possible 4-decimal value, pre-trimmed:
+    # _FRAC[5000] == b".5", _FRAC[0] == b"" — formatting a point becomes
+    # one divmod and a table hit instead of printf + two rstrips.
+    _FRAC = [b"" if f == 0 else (b"." + (b"%04d" % f).rstrip(b"0"))
+             for f in range(10000)]
+
     # ── List upload (single chunk ≤ 1000 pts) ─────────────────────────────
+    def _setup_list(self, mode, dwell):
+        """Phase-1 list setup as one compound message.
+
+        Order follows manual Figure B-2: FUNC:MODE → RANG (full-scale,
+        PAR 4.5.1.2) → LIST:CLE → *WAI (PAR A.17) → LIST:DWEL before the
+        values.  Chaining with ';:' resets the parser to the root per
+        segment; the whole line is ~60 bytes, well inside the card's
+        253-byte input buffer, so setup costs one command gap instead
+        of five.  *CLS is intentionally NOT sent — the manual examples
+        never use it for list operations, and it forces the card to
+        "operation complete idle" which can confuse subsequent
+        synchronisation on some firmware revisions.
+        """
+        return self.send_cmd(
+            f"FUNC:MODE {mode};:{mode}:RANG 1;:LIST:CLE;*WAI"
+            f";:LIST:DWEL {dwell:.6f}") is not None
+
+    @staticmethod
+    def _pack_list_cmds(points, mode):
+        """Pack points into ready-to-send LIST:{mode} command lines.
+
+        Returns a list of (line, value_count) tuples where each line is
+        newline-terminated ASCII bytes — encoded once here so the send
+        paths never re-run str→bytes per batch.  Each line stays within
+        CHUNK_CMD_LIMIT characters (well under the card's 253-byte input
+        buffer) and LIST_VALUES_PER_CMD values.  Values are formatted
+        once up front and the joined length is tracked incrementally —
+        re-joining the batch per point is quadratic on 1000-point
+        chunks.
+        """
+        prefix = f"LIST:{mode} ".encode("ascii")
+
+        # Quantize all points to 0.1 mV/mA integers in one numpy pass,
+        # then format each as whole-part printf + fraction table lookup.
+        # Matches the old per-point f"{v:.4f}".rstrip('0').rstrip('.')
+        # (manual's compact integer style) — including "-0" for tiny
+        # negatives, hence signbit rather than the sign of the rounded
+        # integer.  Sole divergence: exact decimal midpoints like
+        # 0.00005 round half-even here (±1 in the 4th decimal, beneath
+        # the card's resolution).
+        arr = np.asarray(points, dtype=np.float64)
+        quantized = np.rint(np.abs(arr) * 10000.0).astype(np.int64)
+        frac = KepcoController._FRAC
+
+        def _vals():
+            for n, neg in zip(quantized.tolist(),
+                              np.signbit(arr).tolist()):
+                w, f = divmod(n, 10000)
+                yield (b"-%d" % w if neg else b"%d" % w) + frac[f]
+
+        cmds = []
+        buf = []
+        cur_len = len(prefix)
+        for v in _vals():
+            add = len(v) + 1 if buf else len(v)    # +1 for the comma
+            if buf and (cur_len + add > CHUNK_CMD_LIMIT
+                        or len(buf) >= LIST_VALUES_PER_CMD):
+                cmds.append((prefix + b",".join(buf) + b"\n", len(buf)))
+                buf = []
+                cur_len = len(prefix)
+                add = len(v)
+            buf.append(v)
+            cur_len += add
+        if buf:
+            cmds.append((prefix + b",".join(buf) + b"\n", len(buf)))
+        return cmds
+
     def upload_list_chunk(self, points, dwell, mode="VOLT",
-                          progress_cb=None):
+                          progress_cb=None, packed=None):
         """Upload one chunk (≤ 1000 points) with paced writes + verification.
 
         Strategy (follows manual Figure B-2 order):
@@ -383,67 +619,32 @@ class KepcoController:
         command processor (no response to time-out on).
 
         progress_cb(sent, total) is called after each batch if provided.
+        *packed* lets callers pass a precomputed _pack_list_cmds result
+        so looping runs don't re-format identical data every iteration.
         """
         if not self.connected and not self._safe_reconnect():
             return False, "Not connected"
-        if not points:
+        if points is None or len(points) == 0:
             return False, "Empty point list"
         if len(points) > MAX_LIST_POINTS:
             return False, f"Chunk exceeds {MAX_LIST_POINTS} points"
 
         try:
-            # ── Phase 1: Setup (order follows manual Figure B-2) ──
-            #   FUNC:MODE → RANG → LIST:CLE → *WAI → LIST:DWEL
-            # NOTE: *CLS is intentionally NOT sent here — the manual
-            # examples never use it for list operations, and it forces
-            # the card to "operation complete idle" which can confuse
-            # subsequent synchronisation on some firmware revisions.
-            setup_cmds = [
-                f"FUNC:MODE {mode}",
-                f"{mode}:RANG 1",         # full-scale (PAR 4.5.1.2)
-                "LIST:CLE",
-                "*WAI",                   # wait for LIST:CLE (PAR A.17)
-                f"LIST:DWEL {dwell:.6f}", # dwell BEFORE values (manual order)
-            ]
-            for cmd in setup_cmds:
-                if self.send_cmd(cmd) is None:
-                    return False, f"Setup '{cmd}' failed: {self.last_error}"
+            # ── Phase 1: Setup ──
+            if not self._setup_list(mode, dwell):
+                return False, f"Setup failed: {self.last_error}"
 
             # ── Phase 2: Send list values ──
-            prefix = f"LIST:{mode} "
             total = len(points)
             sent = 0
-            buf = []
-
-            def _fmt(v):
-                """Compact value format — matches manual's integer style."""
-                s = f"{v:.4f}"
-                if '.' in s:
-                    s = s.rstrip('0').rstrip('.')
-                return s
-
-            for pt in points:
-                v = _fmt(pt)
-                trial = buf + [v]
-                trial_len = len(prefix) + len(",".join(trial))
-                if (trial_len > CHUNK_CMD_LIMIT
-                        or len(trial) > LIST_VALUES_PER_CMD) and buf:
-                    if self.send_cmd(prefix + ",".join(buf)) is None:
-                        return False, (
-                            f"List send failed at pt {sent}/{total}: "
-                            f"{self.last_error}")
-                    sent += len(buf)
-                    if progress_cb:
-                        progress_cb(sent, total)
-                    buf = []
-                buf.append(v)
-
-            if buf:
-                if self.send_cmd(prefix + ",".join(buf)) is None:
+            if packed is None:
+                packed = self._pack_list_cmds(points, mode)
+            for line, n_vals in packed:
+                if self._send_cmd_bytes(line) is None:
                     return False, (
                         f"List send failed at pt {sent}/{total}: "
                         f"{self.last_error}")
-                sent += len(buf)
+                sent += n_vals
                 if progress_cb:
                     progress_cb(sent, total)
 
@@ -474,20 +675,98 @@ class KepcoController:
         except Exception as e:
             return False, str(e)
 
+    def upload_list_chunk_pipelined(self, points, dwell, mode="VOLT",
+                                    progress_cb=None, pipeline_depth=2,
+                                    packed=None):
+        """Upload one chunk with a small send-window instead of strict
+        send → gap → drain per batch.
+
+        The serial path spends most of its wall-clock in deadtime: one
+        RTT plus the mandatory 35 ms gap per LIST:{mode} batch.  Here
+        *pipeline_depth* batches are concatenated with newline
+        separators into a single sendall, followed by one combined gap
+        (depth × SCPI_CMD_GAP) and one echo sweep — the card ingests
+        the next batch while still pacing the previous one.  Each
+        individual command still respects CHUNK_CMD_LIMIT, so no single
+        SCPI message can overflow the card's 253-byte input buffer.
+
+        Setup and verification are identical to upload_list_chunk; if
+        post-upload verification fails, the upload is retried once via
+        the conservative serial path.
+        """
+        if not self.connected and not self._safe_reconnect():
+            return False, "Not connected"
+        if points is None or len(points) == 0:
+            return False, "Empty point list"
+        if len(points) > MAX_LIST_POINTS:
+            return False, f"Chunk exceeds {MAX_LIST_POINTS} points"
+        depth = max(1, int(pipeline_depth))
+
+        try:
+            # ── Phase 1: Setup (same compound message as serial path) ──
+            if not self._setup_list(mode, dwell):
+                return False, f"Setup failed: {self.last_error}"
+
+            # ── Phase 2: Send list values, *depth* batches per write ──
+            total = len(points)
+            sent = 0
+            cmds = packed if packed is not None \
+                else self._pack_list_cmds(points, mode)
+            for i in range(0, len(cmds), depth):
+                window = cmds[i:i + depth]
+                wire = b"".join(line for line, _ in window)
+                with self._lock:
+                    try:
+                        self._pace()
+                        self._set_timeout(RECV_TIMEOUT)
+                        self.sock.sendall(wire)
+                        time.sleep(SCPI_CMD_GAP * len(window))
+                        self._drain_stale()    # sweep the batched echoes
+                    except Exception as e:
+                        self.last_error = str(e)
+                        self.disconnect()
+                        return False, (
+                            f"List send failed at pt {sent}/{total}: "
+                            f"{self.last_error}")
+                sent += sum(n for _, n in window)
+                if progress_cb:
+                    progress_cb(sent, total)
+
+            # ── Phase 3: Verify (fall back to serial on mismatch) ──
+            if not self.sync():
+                return False, f"Post-upload *WAI failed: {self.last_error}"
+
+            pcount_str = self.send_query(f"LIST:{mode}:POIN?")
+            verified = True
+            if pcount_str is not None:
+                try:
+                    verified = int(pcount_str.strip()) == total
+                except ValueError:
+                    pass  # non-numeric, skip verify
+            errors = self.drain_errors()
+            if not verified or errors:
+                return self.upload_list_chunk(points, dwell, mode=mode,
+                                              progress_cb=progress_cb,
+                                              packed=cmds)
+
+            return True, (
+                f"{total} pts @ {dwell*1000:.3f} ms/step "
+                f"(pipelined x{depth}, verified)")
+
+        except Exception as e:
+            return False, str(e)
+
     # ── Run / Stop ─────────────────────────────────────────────────────────
     def run_list(self, mode="VOLT", count=1):
         """Start LIST execution: COUNT → OUTP ON → {mode}:MODE LIST.
 
-        Follows the manual's Figure B-2 sequence exactly.
+        Follows the manual's Figure B-2 sequence exactly, chained into
+        one compound message.
         """
         try:
-            for cmd in [
-                f"LIST:COUN {count}",
-                "OUTP ON",
-                f"{mode}:MODE LIST",
-            ]:
-                if self.send_cmd(cmd) is None:
-                    return False, f"Run '{cmd}' failed: {self.last_error}"
+            cmd = f"LIST:COUN {count};:OUTP ON;:{mode}:MODE LIST"
+            if self.send_cmd(cmd) is None:
+                return False, f"Run '{cmd}' failed: {self.last_error}"
             return True, "Running"
         except Exception as e:
             return False, str(e)
@@ -495,14 +774,9 @@ class KepcoController:
     def stop(self):
         """Stop LIST, return to safe fixed-output state."""
         try:
-            for cmd in [
-                "VOLT:MODE FIX",
-                "CURR:MODE FIX",
-                "OUTP OFF",
-                "FUNC:MODE VOLT",
-            ]:
-                if self.send_cmd(cmd) is None:
-                    return False, f"Stop '{cmd}' failed: {self.last_error}"
+            cmd = "VOLT:MODE FIX;:CURR:MODE FIX;:OUTP OFF;:FUNC:MODE VOLT"
+            if self.send_cmd(cmd) is None:
+                return False, f"Stop '{cmd}' failed: {self.last_error}"
             return True, "Stopped"
         except Exception as e:
             return False, str(e)
@@ -521,6 +795,10 @@ class Discovery:
                 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 s.settimeout(timeout)
                 s.connect((ip_str, port))
+                try:
+                    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
                 s.sendall(b"*IDN?\n")
                 resp = s.recv(512).decode("ascii", errors="ignore").strip()
                 s.close()
@@ -533,38 +811,190 @@ class Discovery:
 
     @staticmethod
     def scan_subnet(base_ip, callback=None, progress_cb=None):
+        """Sweep all /24 hosts with one selectors-driven event loop.
+
+        Every host gets non-blocking sockets to BOTH ports at once
+        (Telnet 5024 and raw 5025, racing instead of sequential
+        fallback); a selectors.DefaultSelector (epoll on Linux) waits
+        for writability (connect finished), sends *IDN? and waits for
+        the reply.  At most DISCOVERY_MAX_INFLIGHT sockets are
+        registered at a time — the next host is pulled off the
+        generator as probes retire — so a /24 stays well inside
+        conservative fd limits (macOS defaults to 256).  The first
+        socket per host that identifies as a Kepco wins: it is kept
+        open with SO_KEEPALIVE and returned in the results as
+        (ip, idn, sock, port) so the UI can adopt it and skip a fresh
+        handshake on "Connect".  The whole sweep runs on the calling
+        thread — no worker threads, no lock — and finishes in roughly
+        the slowest single probe instead of 6 sequential 50-thread
+        batches.  *callback* always fires, even if the sweep dies, so
+        the UI can re-enable itself.
+        """
         try:
             net = ipaddress.IPv4Network(base_ip + "/24", strict=False)
         except Exception:
             net = ipaddress.IPv4Network("192.168.50.0/24") #let's use 50
 
-        hosts = [str(h) for h in net.hosts()]
+        # Host strings straight from integer arithmetic — no per-host
+        # IPv4Address objects, no up-front list (a /20 would eagerly
+        # build 4094 of each before the first probe).
+        base = int(net.network_address)
+        total = max(net.num_addresses - 2, 0)
+        hosts = (socket.inet_ntoa(struct.pack(">I", base + i))
+                 for i in range(1, total + 1))
         results = []
-        total = len(hosts)
-        done = [0]
-        lock = threading.Lock()
-
-        def worker(ip):
-            r = Discovery._probe(ip)
-            with lock:
-                done[0] += 1
-                if r:
-                    results.append(r)
-                if progress_cb and done[0] % 10 == 0:
-                    progress_cb(done[0], total)
-
-        batch = 50
-        for i in range(0, len(hosts), batch):
-            chunk = hosts[i:i + batch]
-            thrds = [threading.Thread(target=worker, args=(ip,), daemon=True)
-                     for ip in chunk]
-            for t in thrds:
-                t.start()
-            for t in thrds:
-                t.join(timeout=3)
-
-        if callback:
-            callback(results)
+        done = 0
+
+        class _Probe:
+            __slots__ = ("ip", "port", "deadline", "awaiting", "buf")
+
+            def __init__(self, ip, port):
+                self.ip = ip
+                self.port = port
+                self.deadline = time.time() + DISCOVERY_TIMEOUT
+                self.awaiting = False   # False: connecting, True: reading
+                self.buf = b""
+
+        ports = (TELNET_PORT, SCPI_SOCKET_PORT)
+        sel = selectors.DefaultSelector()
+        left = {}     # ip → probes still in flight
+        hits = {}     # ip → (idn, kept socket, port) of the first match
+        inflight = 0  # sockets currently registered with sel
+        # non-blocking connect in progress: POSIX reports EINPROGRESS/
+        # EWOULDBLOCK, Windows WSAEWOULDBLOCK (10035)
+        conn_ok = (0, errno.EINPROGRESS, errno.EWOULDBLOCK,
+                   getattr(errno, "WSAEWOULDBLOCK", 10035))
+
+        def _start(ip, port):
+            nonlocal inflight
+            try:
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError:       # fd limit — treat as an unreachable port
+                return False
+            s.setblocking(False)
+            err = s.connect_ex((ip, port))
+            if err not in conn_ok:
+                s.close()
+                return False
+            sel.register(s, selectors.EVENT_WRITE, _Probe(ip, port))
+            inflight += 1
+            return True
+
+        def _launch_more():
+            """Top the in-flight window back up from the host generator."""
+            nonlocal done
+            while inflight < DISCOVERY_MAX_INFLIGHT:
+                ip = next(hosts, None)
+                if ip is None:
+                    return
+                n = sum(1 for port in ports if _start(ip, port))
+                if n:
+                    left[ip] = n
+                else:
+                    done += 1
+
+        def _finish(sock, probe, matched=None):
+            """Retire one socket; count the host done when both are."""
+            nonlocal done, inflight
+            try:
+                sel.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+            inflight -= 1
+            ip = probe.ip
+            if matched and ip not in hits:
+                # keep the live socket for adoption by the UI
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET,
+                                    socket.SO_KEEPALIVE, 1)
+                except OSError:
+                    pass
+                hits[ip] = (matched, sock, probe.port)
+            else:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            left[ip] -= 1
+            if left[ip] == 0:
+                if ip in hits:
+                    idn, kept, port = hits[ip]
+                    results.append((ip, idn, kept, port))
+                done += 1
+                if progress_cb:
+                    progress_cb(done, total)
+            _launch_more()
+
+        _launch_more()
+
+        try:
+            while done < total:
+                now = time.time()
+                pending = [(k.fileobj, k.data) for k in
+                           sel.get_map().values()]
+                if not pending:
+                    break
+                wait = max(0.0, min(p.deadline for _, p in pending) - now)
+                events = sel.select(timeout=wait)
+                for key, _mask in events:
+                    sock, probe = key.fileobj, key.data
+                    if not probe.awaiting:
+                        # connect finished — check it actually succeeded
+                        err = sock.getsockopt(socket.SOL_SOCKET,
+                                              socket.SO_ERROR)
+                        if err:
+                            _finish(sock, probe)
+                            continue
+                        try:
+                            sock.setsockopt(socket.IPPROTO_TCP,
+                                            socket.TCP_NODELAY, 1)
+                        except OSError:
+                            pass
+                        try:
+                            sock.sendall(b"*IDN?\n")
+                        except OSError:
+                            _finish(sock, probe)
+                            continue
+                        probe.awaiting = True
+                        sel.modify(sock, selectors.EVENT_READ, probe)
+                        continue
+                    try:
+                        data = sock.recv(512)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        _finish(sock, probe)
+                        continue
+                    if not data:
+                        _finish(sock, probe)
+                        continue
+                    probe.buf += data
+                    resp = probe.buf.decode("ascii",
+                                            errors="ignore").strip()
+                    up = resp.upper()
+                    if "KEPCO" in up or "BOP" in up or "BIT" in up:
+                        # answered with an identity — done with this host
+                        _finish(sock, probe, matched=resp)
+                    elif len(probe.buf) > 4096:
+                        _finish(sock, probe)
+                    # else: partial reply, keep waiting until deadline
+                # sweep expired probes
+                now = time.time()
+                for sock, probe in [(k.fileobj, k.data) for k in
+                                    sel.get_map().values()]:
+                    if now >= probe.deadline:
+                        _finish(sock, probe)
+        finally:
+            for key in list(sel.get_map().values()):
+                try:
+                    key.fileobj.close()
+                except OSError:
+                    pass
+            sel.close()
+            # from the finally: the UI's done-callback must fire even if
+            # the sweep blew up, or the Scan button stays stuck
+            if callback:
+                callback(results)
         return results
 
 
@@ -602,35 +1032,77 @@ class WaveformGen:
 
     @staticmethod
     def generate(wave_type, n, amplitude, offset):
-        pts = []
+        """Build one period as a vectorized NumPy pass (one C loop per
+        waveform instead of n Python iterations); returns the float64
+        ndarray directly — callers slice it into zero-copy views for
+        the graph and the upload packer."""
+        i = np.arange(n, dtype=np.float64)
         if wave_type == "Sine":
-            for i in range(n):
-                pts.append(offset + amplitude * math.sin(2 * math.pi * i / n))
+            k = 2.0 * np.pi / n       # one scalar, one multiply per sample
+            pts = offset + amplitude * np.sin(k * i)
         elif wave_type == "Square":
-            for i in range(n):
-                pts.append(offset + amplitude if i < n / 2
-                           else offset - amplitude)
+            # fill + slice assign: no comparison array, no np.where select
+            pts = np.full(n, offset - amplitude)
+            pts[:(n + 1) // 2] = offset + amplitude
         elif wave_type == "Triangle":
             half = n // 2 or 1
-            for i in range(n):
-                if i <= half:
-                    pts.append(offset - amplitude + (2 * amplitude / half) * i)
-                else:
-                    pts.append(offset + amplitude
-                               - (2 * amplitude / half) * (i - half))
+            slope = 2 * amplitude / half
+            # fold the rising/falling halves with |i - half|: branchless,
+            # no per-half temporaries
+            pts = offset + amplitude - slope * np.abs(i - half)
         elif wave_type == "Sawtooth":
             step = (2 * amplitude) / max(n - 1, 1)
-            for i in range(n):
-                pts.append(offset - amplitude + step * i)
+            pts = offset - amplitude + step * i
         else:
-            pts = [offset] * n
+            pts = np.full(n, float(offset))
+        return pts
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def generate_cached(wave_type, n, amplitude, offset):
+        """Memoized generate() for the preview→run double call.
+
+        Preview and Run synthesize the identical waveform back to back;
+        the cache hands Run the very array Preview plotted (which also
+        lets the graph's identity check keep its blit state).  Arrays
+        are frozen read-only because they are shared between callers.
+        """
+        pts = WaveformGen.generate(wave_type, n, amplitude, offset)
+        pts.setflags(write=False)
         return pts
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  Application  (Material-themed, customtkinter)
 # ═══════════════════════════════════════════════════════════════════════════
+_LOG_SYMS = {"info": "ℹ", "ok": "✓", "warn": "⚠", "err": "✗"}
+
+_last_ts = [0, ""]
+
+
+def _ts():
+    """HH:MM:SS for log lines, re-formatted at most once per second.
+
+    strftime is surprisingly costly for something called on every log
+    line and console exchange; within the same second this is a list
+    lookup.
+    """
+    s = int(time.time())
+    if s != _last_ts[0]:
+        _last_ts[0] = s
+        _last_ts[1] = time.strftime("%H:%M:%S", time.localtime(s))
+    return _last_ts[1]
+
+
 class App:
+    # quick SCPI buttons in the manual tab: (command, button width)
+    _QUICK_CMDS = (
+        ("*IDN?", 72), ("SYST:ERR?", 92), ("OUTP?", 72),
+        ("MEAS:VOLT?", 102), ("MEAS:CURR?", 102),
+        ("*OPC?", 72), ("FUNC:MODE?", 102),
+        ("LIST:VOLT:POIN?", 124), ("LIST:CURR:POIN?", 124),
+    )
+
     def __init__(self):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -640,14 +1112,49 @@ class App:
         self.root.geometry("1160x870")
         self.root.minsize(980, 750)
 
+        # Shared CTkFont cache: every inline CTkFont(...) allocates a
+        # fresh Tk font resource, and _build_ui used to create dozens of
+        # identical ones.  One instance per style, shared by reference.
+        self.F = {
+            "tiny":    ctk.CTkFont(size=10),
+            "small":   ctk.CTkFont(size=11),
+            "small_i": ctk.CTkFont(size=11, slant="italic"),
+            "lbl":     ctk.CTkFont(size=12),
+            "md":      ctk.CTkFont(size=13),
+            "lbl_b":   ctk.CTkFont(size=13, weight="bold"),
+            "btn":     ctk.CTkFont(size=14, weight="bold"),
+            "hdr":     ctk.CTkFont(size=15, weight="bold"),
+            "mono":    ctk.CTkFont(family="Consolas", size=11),
+            "mono_sm": ctk.CTkFont(family="Consolas", size=12),
+            "mono_md": ctk.CTkFont(family="Consolas", size=14),
+            "mono_lg": ctk.CTkFont(family="Consolas", size=22),
+        }
+
         self.kepco = KepcoController()
         self.csv_points = None
         self.current_points = []
         self.is_running = False
         self.stop_event = threading.Event()
+        self._found_socks = {}   # ip → (live socket, port) from discovery
+
+        # graph blitting state (see _build_graph)
+        self._graph_points = None
+        self._graph_chunk_idx = -1
+        self._lc = None
+        self._nc = 0
+        self._chunk_rgba = None
+        self._graph_bg = None
+        self._graph_title = None
+        self._pending_graph = (None, -1)
+        self._graph_redraw_scheduled = False
+        self._xcache = {}
+
+        # worker → UI event queue, drained by one recurring idle handler
+        self._ui_q = _queue.SimpleQueue()
 
         self._build_ui()
         self._update_graph()
+        self.root.after(20, self._drain_ui)
 
     # ──────────────────────────────────────────────────────────────────────
     #  UI construction
@@ -658,39 +1165,40 @@ class App:
         conn.pack(fill="x", padx=12, pady=(10, 4))
 
         ctk.CTkLabel(conn, text="IP Address:",
-                     font=ctk.CTkFont(size=13)).pack(side="left", padx=(14, 4))
+                     font=self.F["md"]).pack(side="left", padx=(14, 4))
         self.ip_var = ctk.StringVar(value="192.168.50.10")
         self.ip_combo = ctk.CTkComboBox(
             conn, variable=self.ip_var,
             values=["192.168.50.10"], width=200,
-            font=ctk.CTkFont(size=13))
+            font=self.F["md"])
         self.ip_combo.pack(side="left", padx=4)
 
         self.scan_btn = ctk.CTkButton(
             conn, text="⟳  Scan Network", width=140,
             command=self._start_scan,
             fg_color="#374151", hover_color="#4b5563",
-            font=ctk.CTkFont(size=12))
+            font=self.F["lbl"])
         self.scan_btn.pack(side="left", padx=6)
 
         self.conn_btn = ctk.CTkButton(
             conn, text="Connect", width=110,
             command=self._toggle_connect,
             fg_color=C["primary"], hover_color=C["primary_h"],
-            font=ctk.CTkFont(size=13, weight="bold"))
+            font=self.F["lbl_b"])
         self.conn_btn.pack(side="left", padx=6)
 
         self.status_lbl = ctk.CTkLabel(conn, text="●  Disconnected",
                                        text_color=C["red"],
-                                       font=ctk.CTkFont(size=13))
+                                       font=self.F["md"])
         self.status_lbl.pack(side="left", padx=14)
 
         self.idn_lbl = ctk.CTkLabel(conn, text="", text_color=C["text2"],
-                                    font=ctk.CTkFont(size=11, slant="italic"))
+                                    font=self.F["small_i"])
         self.idn_lbl.pack(side="right", padx=14)
 
         # ═══ Middle: Tabbed interface ═══
-        self.tabview = ctk.CTkTabview(self.root, corner_radius=12)
+        self.tabview = ctk.CTkTabview(self.root, corner_radius=12,
+                                      command=self._on_tab_change)
         self.tabview.pack(fill="both", expand=True, padx=12, pady=4)
 
         wf_tab = self.tabview.add("🔊  Waveform Generator")
@@ -705,7 +1213,7 @@ class App:
         cfg.pack_propagate(False)
 
         ctk.CTkLabel(cfg, text="Waveform Configuration",
-                     font=ctk.CTkFont(size=15, weight="bold")).pack(
+                     font=self.F["hdr"]).pack(
             padx=14, pady=(14, 10))
 
         # Waveform type
@@ -726,7 +1234,7 @@ class App:
         self.csv_btn.pack(side="left", padx=(0, 8))
         self.csv_lbl = ctk.CTkLabel(self.csv_frame, text="No file",
                                     text_color=C["text2"],
-                                    font=ctk.CTkFont(size=11))
+                                    font=self.F["small"])
         self.csv_lbl.pack(side="left")
 
         # Numeric fields
@@ -770,27 +1278,42 @@ class App:
         ctk.CTkButton(cfg, text="Preview Waveform",
                       command=self._preview,
                       fg_color="#374151", hover_color="#4b5563",
-                      font=ctk.CTkFont(size=12)).pack(
+                      font=self.F["lbl"]).pack(
             fill="x", padx=14, pady=(6, 4))
 
         # Timing info
         self.timing_lbl = ctk.CTkLabel(
             cfg, text="", text_color=C["amber"],
-            font=ctk.CTkFont(size=11), wraplength=260, justify="left")
+            font=self.F["small"], wraplength=260, justify="left")
         self.timing_lbl.pack(fill="x", padx=14, pady=(4, 10))
 
         # ── Right: graph ──
         graph_outer = ctk.CTkFrame(wf_inner, corner_radius=12)
         graph_outer.pack(side="left", fill="both", expand=True)
 
-        self.fig = Figure(figsize=(7, 4), dpi=100, facecolor=C["graph_bg"])
+        # Constrained layout is solved incrementally by matplotlib
+        # itself, replacing the explicit tight_layout() pass that used
+        # to re-measure every tick label on each graph rebuild.
+        self.fig = Figure(figsize=(7, 4), dpi=100, facecolor=C["graph_bg"],
+                          layout="constrained")
         self.ax = self.fig.add_subplot(111)
         self._style_ax()
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_outer)
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=6, pady=6)
+        # a resize invalidates the cached blit background
+        self.canvas.mpl_connect("resize_event", self._on_canvas_resize)
 
         # ── Manual Override Tab ──
-        self._build_manual_tab(man_tab)
+        # Built lazily on first visit: ~50 widgets the user may never
+        # open don't belong in cold startup.  State that the rest of
+        # the app touches regardless of the tab lives here instead.
+        self._man_tab_parent = man_tab
+        self._man_tab_built = False
+        self.auto_meas_var = ctk.BooleanVar(value=False)
+        self._meas_timer = None
+        self._meas_next_t = 0.0
+        self._meas_inflight = False
+        self._health_inflight = False
 
         # ═══ Bottom: controls + progress ═══
         bot = ctk.CTkFrame(self.root, corner_radius=10)
@@ -799,18 +1322,18 @@ class App:
         self.run_btn = ctk.CTkButton(
             bot, text="▶  Upload & Run", width=170,
             command=self._run, fg_color=C["green"], hover_color="#059669",
-            text_color="#000", font=ctk.CTkFont(size=14, weight="bold"))
+            text_color="#000", font=self.F["btn"])
         self.run_btn.pack(side="left", padx=(14, 8), pady=10)
 
         self.stop_btn = ctk.CTkButton(
             bot, text="■  Stop", width=110,
             command=self._stop, fg_color=C["red"], hover_color="#dc2626",
-            font=ctk.CTkFont(size=14, weight="bold"))
+            font=self.F["btn"])
         self.stop_btn.pack(side="left", padx=8, pady=10)
 
         self.prog_lbl = ctk.CTkLabel(bot, text="Idle",
                                      text_color=C["text2"],
-                                     font=ctk.CTkFont(size=12))
+                                     font=self.F["lbl"])
         self.prog_lbl.pack(side="left", padx=20)
 
         self.progress = ctk.CTkProgressBar(bot, width=220)
@@ -823,22 +1346,39 @@ class App:
 
         self.log_text = ctk.CTkTextbox(
             log_wrap, height=120,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self.F["mono"],
             activate_scrollbars=True)
         self.log_text.pack(fill="both", padx=6, pady=6, expand=True)
+        self.log_text.configure(state="disabled")
 
     # ── helpers ────────────────────────────────────────────────────────────
-    @staticmethod
-    def _lbl(parent, text):
+    def _lbl(self, parent, text):
         ctk.CTkLabel(parent, text=text, text_color=C["text2"],
-                     font=ctk.CTkFont(size=12)).pack(
+                     font=self.F["lbl"]).pack(
             anchor="w", padx=14, pady=(6, 1))
 
     def log(self, msg, tag="info"):
-        ts = time.strftime("%H:%M:%S")
-        sym = {"info": "ℹ", "ok": "✓", "warn": "⚠", "err": "✗"}.get(tag, "·")
-        self.log_text.insert("end", f"[{ts}] {sym}  {msg}\n")
-        self.log_text.see("end")
+        ts = _ts()
+        sym = _LOG_SYMS.get(tag, "·")
+        self._append_textbox(self.log_text, f"[{ts}] {sym}  {msg}\n")
+
+    @staticmethod
+    def _append_textbox(box, text, max_lines=2000):
+        """Append to a console textbox kept read-only between writes.
+
+        The boxes live in the disabled state so Tk's Text widget skips
+        edit/undo bookkeeping and users can't type into them; writes
+        briefly re-enable, insert, trim and disable again.  Past
+        max_lines the oldest ~500 lines go in one range delete —
+        CTkTextbox slows down and eventually freezes as its line count
+        grows unchecked.
+        """
+        box.configure(state="normal")
+        box.insert("end", text)
+        if int(box.index("end-1c").split(".")[0]) > max_lines:
+            box.delete("1.0", "500.0")
+        box.configure(state="disabled")
+        box.see("end")
 
     # ──────────────────────────────────────────────────────────────────────
     #  Manual Override Tab
@@ -852,14 +1392,14 @@ class App:
         left.pack(side="left", fill="y", padx=(0, 6), pady=0)
 
         ctk.CTkLabel(left, text="Output Control",
-                     font=ctk.CTkFont(size=15, weight="bold")).pack(
+                     font=self.F["hdr"]).pack(
             padx=14, pady=(10, 8))
 
         # Output ON / OFF
         out_row = ctk.CTkFrame(left, fg_color="transparent")
         out_row.pack(fill="x", padx=14, pady=(0, 8))
         ctk.CTkLabel(out_row, text="Output:",
-                     font=ctk.CTkFont(size=13)).pack(side="left")
+                     font=self.F["md"]).pack(side="left")
         self.man_outp_var = ctk.StringVar(value="OFF")
         self.man_outp_switch = ctk.CTkSwitch(
             out_row, text="", variable=self.man_outp_var,
@@ -869,7 +1409,7 @@ class App:
         self.man_outp_switch.pack(side="left", padx=8)
         self.man_outp_lbl = ctk.CTkLabel(
             out_row, text="OFF", text_color=C["red"],
-            font=ctk.CTkFont(size=13, weight="bold"))
+            font=self.F["lbl_b"])
         self.man_outp_lbl.pack(side="left")
 
         # Operating Mode
@@ -893,19 +1433,19 @@ class App:
 
         # ── Set Values ──
         ctk.CTkLabel(left, text="Set Values",
-                     font=ctk.CTkFont(size=14, weight="bold")).pack(
+                     font=self.F["btn"]).pack(
             padx=14, pady=(4, 2))
         ctk.CTkLabel(left, text="In Voltage mode: VOLT = output, CURR = limit\n"
                      "In Current mode: CURR = output, VOLT = limit",
                      text_color=C["text2"],
-                     font=ctk.CTkFont(size=10), justify="left").pack(
+                     font=self.F["tiny"], justify="left").pack(
             anchor="w", padx=14, pady=(0, 6))
 
         # Voltage
         v_row = ctk.CTkFrame(left, fg_color="transparent")
         v_row.pack(fill="x", padx=14, pady=(0, 4))
         ctk.CTkLabel(v_row, text="Voltage (V):",
-                     font=ctk.CTkFont(size=12), width=100).pack(side="left")
+                     font=self.F["lbl"], width=100).pack(side="left")
         self.man_volt_entry = ctk.CTkEntry(v_row, width=110,
                                            placeholder_text="0.0")
         self.man_volt_entry.insert(0, "0.0")
@@ -919,7 +1459,7 @@ class App:
         c_row = ctk.CTkFrame(left, fg_color="transparent")
         c_row.pack(fill="x", padx=14, pady=(0, 4))
         ctk.CTkLabel(c_row, text="Current (A):",
-                     font=ctk.CTkFont(size=12), width=100).pack(side="left")
+                     font=self.F["lbl"], width=100).pack(side="left")
         self.man_curr_entry = ctk.CTkEntry(c_row, width=110,
                                            placeholder_text="0.0")
         self.man_curr_entry.insert(0, "0.0")
@@ -934,11 +1474,11 @@ class App:
 
         # ── Range ──
         ctk.CTkLabel(left, text="Range Control",
-                     font=ctk.CTkFont(size=14, weight="bold")).pack(
+                     font=self.F["btn"]).pack(
             padx=14, pady=(4, 2))
         ctk.CTkLabel(left, text="Full-scale avoids quarter-scale transients",
                      text_color=C["text2"],
-                     font=ctk.CTkFont(size=10)).pack(
+                     font=self.F["tiny"]).pack(
             anchor="w", padx=14, pady=(0, 6))
 
         rng_row = ctk.CTkFrame(left, fg_color="transparent")
@@ -959,7 +1499,7 @@ class App:
         ctk.CTkButton(left, text="⟲  Reset Device (*RST)", width=220,
                       command=self._man_reset,
                       fg_color=C["red"], hover_color="#dc2626",
-                      font=ctk.CTkFont(size=13, weight="bold")).pack(
+                      font=self.F["lbl_b"]).pack(
             padx=14, pady=(4, 12))
 
         # ── Right column: Measurements + SCPI Console ──
@@ -967,7 +1507,7 @@ class App:
         right.pack(side="left", fill="both", expand=True)
 
         ctk.CTkLabel(right, text="Live Measurements",
-                     font=ctk.CTkFont(size=15, weight="bold")).pack(
+                     font=self.F["hdr"]).pack(
             padx=14, pady=(14, 8))
 
         meas_card = ctk.CTkFrame(right, corner_radius=10,
@@ -976,25 +1516,24 @@ class App:
 
         self.meas_volt_lbl = ctk.CTkLabel(
             meas_card, text="Voltage:   — — —  V",
-            font=ctk.CTkFont(family="Consolas", size=22),
+            font=self.F["mono_lg"],
             text_color="#60a5fa")
         self.meas_volt_lbl.pack(padx=20, pady=(16, 4))
 
         self.meas_curr_lbl = ctk.CTkLabel(
             meas_card, text="Current:   — — —  A",
-            font=ctk.CTkFont(family="Consolas", size=22),
+            font=self.F["mono_lg"],
             text_color="#34d399")
         self.meas_curr_lbl.pack(padx=20, pady=(4, 4))
 
         self.meas_mode_lbl = ctk.CTkLabel(
             meas_card, text="Mode:  — — —",
-            font=ctk.CTkFont(family="Consolas", size=14),
+            font=self.F["mono_md"],
             text_color=C["text2"])
         self.meas_mode_lbl.pack(padx=20, pady=(2, 12))
 
         meas_ctrl = ctk.CTkFrame(right, fg_color="transparent")
         meas_ctrl.pack(fill="x", padx=14, pady=(0, 8))
-        self.auto_meas_var = ctk.BooleanVar(value=False)
         ctk.CTkCheckBox(meas_ctrl, text="Auto refresh (1 s)",
                         variable=self.auto_meas_var,
                         command=self._man_toggle_auto_meas).pack(
@@ -1009,22 +1548,22 @@ class App:
 
         # Manual Command Console
         ctk.CTkLabel(right, text="Manual Command Console",
-                     font=ctk.CTkFont(size=14, weight="bold")).pack(
+                     font=self.F["btn"]).pack(
             anchor="w", padx=14, pady=(4, 6))
         ctk.CTkLabel(
             right,
             text="Enter any SCPI command/query, or use quick commands below.",
             text_color=C["text2"],
-            font=ctk.CTkFont(size=10)).pack(anchor="w", padx=14, pady=(0, 6))
+            font=self.F["tiny"]).pack(anchor="w", padx=14, pady=(0, 6))
 
         scpi_row = ctk.CTkFrame(right, fg_color="transparent")
         scpi_row.pack(fill="x", padx=14, pady=(0, 4))
         ctk.CTkLabel(scpi_row, text="CMD:",
-                     font=ctk.CTkFont(family="Consolas", size=12)).pack(
+                     font=self.F["mono_sm"]).pack(
             side="left", padx=(0, 4))
         self.scpi_entry = ctk.CTkEntry(
             scpi_row, placeholder_text="e.g.  *IDN?  or  VOLT 5.0",
-            font=ctk.CTkFont(family="Consolas", size=12))
+            font=self.F["mono_sm"])
         self.scpi_entry.pack(side="left", fill="x", expand=True, padx=4)
         self.scpi_entry.bind("<Return>", lambda e: self._man_send_scpi())
         ctk.CTkButton(scpi_row, text="Send ▶", width=80,
@@ -1032,47 +1571,16 @@ class App:
                       fg_color=C["primary"],
                       hover_color=C["primary_h"]).pack(side="left", padx=4)
 
-        quick_row = ctk.CTkFrame(right, fg_color="transparent")
-        quick_row.pack(fill="x", padx=14, pady=(0, 4))
-        ctk.CTkButton(quick_row, text="*IDN?", width=72,
-                      command=lambda: self._man_send_preset("*IDN?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row, text="SYST:ERR?", width=92,
-                      command=lambda: self._man_send_preset("SYST:ERR?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row, text="OUTP?", width=72,
-                      command=lambda: self._man_send_preset("OUTP?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row, text="MEAS:VOLT?", width=102,
-                      command=lambda: self._man_send_preset("MEAS:VOLT?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row, text="MEAS:CURR?", width=102,
-                      command=lambda: self._man_send_preset("MEAS:CURR?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left")
-
-        quick_row2 = ctk.CTkFrame(right, fg_color="transparent")
-        quick_row2.pack(fill="x", padx=14, pady=(0, 4))
-        ctk.CTkButton(quick_row2, text="*OPC?", width=72,
-                      command=lambda: self._man_send_preset("*OPC?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row2, text="FUNC:MODE?", width=102,
-                      command=lambda: self._man_send_preset("FUNC:MODE?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row2, text="LIST:VOLT:POIN?", width=124,
-                      command=lambda: self._man_send_preset("LIST:VOLT:POIN?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left", padx=(0, 6))
-        ctk.CTkButton(quick_row2, text="LIST:CURR:POIN?", width=124,
-                      command=lambda: self._man_send_preset("LIST:CURR:POIN?"),
-                      fg_color="#374151", hover_color="#4b5563").pack(
-            side="left")
+        for row_cmds in (self._QUICK_CMDS[:5], self._QUICK_CMDS[5:]):
+            quick_row = ctk.CTkFrame(right, fg_color="transparent")
+            quick_row.pack(fill="x", padx=14, pady=(0, 4))
+            for i, (cmd, w) in enumerate(row_cmds):
+                ctk.CTkButton(
+                    quick_row, text=cmd, width=w,
+                    command=functools.partial(self._man_send_preset, cmd),
+                    fg_color="#374151", hover_color="#4b5563").pack(
+                    side="left",
+                    padx=(0, 6) if i < len(row_cmds) - 1 else 0)
 
         scpi_ctrl = ctk.CTkFrame(right, fg_color="transparent")
         scpi_ctrl.pack(fill="x", padx=14, pady=(0, 4))
@@ -1087,11 +1595,16 @@ class App:
 
         self.scpi_resp = ctk.CTkTextbox(
             right, height=120,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=self.F["mono"],
             activate_scrollbars=True)
         self.scpi_resp.pack(fill="both", padx=14, pady=(4, 14), expand=True)
+        self.scpi_resp.configure(state="disabled")
 
-        self._meas_timer = None
+    def _on_tab_change(self):
+        if (not self._man_tab_built
+                and self.tabview.get() == "🔧  Manual Override"):
+            self._man_tab_built = True
+            self._build_manual_tab(self._man_tab_parent)
 
     # ──────────────────────────────────────────────────────────────────────
     #  Manual Override callbacks
@@ -1131,8 +1644,9 @@ class App:
         except ValueError:
             self.log("Invalid voltage value", "err")
             return
-        ok = self.kepco.send(f"VOLT {val:.4f}")
-        self.log(f"VOLT → {val:.4f} V" if ok else "Failed to set voltage",
+        s = format(val, ".4f")   # one format, shared by command and log
+        ok = self.kepco.send(f"VOLT {s}")
+        self.log(f"VOLT → {s} V" if ok else "Failed to set voltage",
                  "ok" if ok else "err")
 
     def _man_set_current(self):
@@ -1143,8 +1657,9 @@ class App:
         except ValueError:
             self.log("Invalid current value", "err")
             return
-        ok = self.kepco.send(f"CURR {val:.4f}")
-        self.log(f"CURR → {val:.4f} A" if ok else "Failed to set current",
+        s = format(val, ".4f")
+        ok = self.kepco.send(f"CURR {s}")
+        self.log(f"CURR → {s} A" if ok else "Failed to set current",
                  "ok" if ok else "err")
 
     def _man_set_range(self):
@@ -1178,11 +1693,27 @@ class App:
             self.log("Reset failed", "err")
 
     def _man_measure(self):
-        if not self.kepco.connected:
+        # Three blocking SCPI round-trips don't belong on the Tk main
+        # thread — a slow link would freeze the whole UI.  Run them in a
+        # worker and marshal the result back with root.after; the
+        # in-flight guard keeps the 1 Hz auto-measure timer from
+        # stacking workers when the instrument is slower than the tick.
+        if not self.kepco.connected or self._meas_inflight:
             return
-        v = self.kepco.send("MEAS:VOLT?", query=True)
-        c = self.kepco.send("MEAS:CURR?", query=True)
-        m = self.kepco.send("FUNC:MODE?", query=True)
+        self._meas_inflight = True
+        threading.Thread(target=self._meas_worker, daemon=True).start()
+
+    def _meas_worker(self):
+        try:
+            v = self.kepco.send("MEAS:VOLT?", query=True)
+            c = self.kepco.send("MEAS:CURR?", query=True)
+            m = self.kepco.send("FUNC:MODE?", query=True)
+        except Exception:
+            v = c = m = None
+        self.root.after(0, lambda: self._meas_apply(v, c, m))
+
+    def _meas_apply(self, v, c, m):
+        self._meas_inflight = False
         try:
             v_str = f"{float(v):.4f}" if v else "— — —"
         except (ValueError, TypeError):
@@ -1197,6 +1728,7 @@ class App:
 
     def _man_toggle_auto_meas(self):
         if self.auto_meas_var.get():
+            self._meas_next_t = time.monotonic()
             self._man_auto_meas_tick()
         else:
             if self._meas_timer:
@@ -1206,7 +1738,18 @@ class App:
     def _man_auto_meas_tick(self):
         if self.auto_meas_var.get() and self.kepco.connected:
             self._man_measure()
-            self._meas_timer = self.root.after(1000, self._man_auto_meas_tick)
+            # Aim at absolute 1 s deadlines instead of "1 s after
+            # whenever this handler got around to running", so handler
+            # and query time don't stretch the effective period.  If
+            # we've fallen a full period behind, resync rather than
+            # firing a catch-up burst.
+            now = time.monotonic()
+            self._meas_next_t += 1.0
+            delay_ms = max(0, int((self._meas_next_t - now) * 1000))
+            if delay_ms == 0:
+                self._meas_next_t = now + 1.0
+            self._meas_timer = self.root.after(delay_ms,
+                                               self._man_auto_meas_tick)
         else:
             self._meas_timer = None
 
@@ -1221,18 +1764,18 @@ class App:
 
     def _man_exec_scpi_command(self, cmd):
         is_query = cmd.rstrip().endswith("?")
-        ts = time.strftime("%H:%M:%S")
+        ts = _ts()
+        # One insert per exchange: each CTkTextbox insert re-lays-out
+        # the widget, so the echo and reply lines go in together.
         if is_query:
             resp = self.kepco.send(cmd, query=True)
-            self.scpi_resp.insert("end", f"[{ts}] > {cmd}\n")
-            self.scpi_resp.insert("end",
-                f"[{ts}] < {resp or '(no response)'}\n")
+            out = (f"[{ts}] > {cmd}\n"
+                   f"[{ts}] < {resp or '(no response)'}\n")
         else:
             ok = self.kepco.send(cmd)
-            self.scpi_resp.insert("end", f"[{ts}] > {cmd}\n")
-            self.scpi_resp.insert("end",
-                f"[{ts}] {'✓ OK' if ok else '✗ Failed'}\n")
-        self.scpi_resp.see("end")
+            out = (f"[{ts}] > {cmd}\n"
+                   f"[{ts}] {'✓ OK' if ok else '✗ Failed'}\n")
+        self._append_textbox(self.scpi_resp, out)
         self.log(f"SCPI: {cmd}", "info")
 
     def _man_send_preset(self, cmd):
@@ -1243,12 +1786,24 @@ class App:
         self._man_exec_scpi_command(cmd)
 
     def _man_clear_scpi(self):
+        self.scpi_resp.configure(state="normal")
         self.scpi_resp.delete("1.0", "end")
+        self.scpi_resp.configure(state="disabled")
         self.log("SCPI console cleared", "info")
 
     def _man_health_check(self):
-        if not self._man_require_conn():
+        # Seven sequential queries ≈ seconds of wall time on a slow
+        # link; run them in a worker and paint the console lines
+        # incrementally from a queue so the UI stays live throughout.
+        if not self._man_require_conn() or self._health_inflight:
             return
+        self._health_inflight = True
+        q = _queue.Queue()
+        threading.Thread(target=self._health_worker, args=(q,),
+                         daemon=True).start()
+        self.root.after(50, self._health_drain, q)
+
+    def _health_worker(self, q):
         checks = [
             "*IDN?",
             "FUNC:MODE?",
@@ -1258,15 +1813,37 @@ class App:
             "SYST:ERR?",
             "*ESR?",
         ]
-        ts = time.strftime("%H:%M:%S")
-        self.scpi_resp.insert("end", f"[{ts}] ==== Health Check ====\n")
+        ts = _ts()
+        q.put(f"[{ts}] ==== Health Check ====\n")
         for cmd in checks:
-            resp = self.kepco.send(cmd, query=True)
-            self.scpi_resp.insert("end", f"[{ts}] > {cmd}\n")
-            self.scpi_resp.insert("end", f"[{ts}] < {resp or '(no response)'}\n")
-        self.scpi_resp.insert("end", f"[{ts}] =====================\n")
-        self.scpi_resp.see("end")
-        self.log("Manual health check complete", "ok")
+            try:
+                resp = self.kepco.send(cmd, query=True)
+            except Exception:
+                resp = None
+            q.put(f"[{ts}] > {cmd}\n")
+            q.put(f"[{ts}] < {resp or '(no response)'}\n")
+        q.put(f"[{ts}] =====================\n")
+        q.put(None)  # sentinel: worker finished
+
+    def _health_drain(self, q):
+        lines = []
+        done = False
+        while True:
+            try:
+                item = q.get_nowait()
+            except _queue.Empty:
+                break
+            if item is None:
+                done = True
+                break
+            lines.append(item)
+        if lines:
+            self._append_textbox(self.scpi_resp, "".join(lines))
+        if done:
+            self._health_inflight = False
+            self.log("Manual health check complete", "ok")
+        else:
+            self.root.after(50, self._health_drain, q)
 
     # ──────────────────────────────────────────────────────────────────────
     #  Graph
@@ -1281,12 +1858,64 @@ class App:
         self.ax.grid(True, color="#2a2a40", linewidth=0.5, alpha=0.6)
 
     def _update_graph(self, points=None, chunk_idx=-1):
+        """Request a graph update, coalescing bursts.
+
+        At most one redraw is ever queued on the Tk event loop; a newer
+        request simply replaces the pending state, so when chunks
+        complete faster than Tk can paint, intermediate states are
+        skipped instead of piling up and starving the UI.
+        """
+        self._pending_graph = (points, chunk_idx)
+        if not self._graph_redraw_scheduled:
+            self._graph_redraw_scheduled = True
+            self.root.after_idle(self._drain_graph_update)
+
+    def _drain_graph_update(self):
+        self._graph_redraw_scheduled = False
+        points, chunk_idx = self._pending_graph
+        self._do_update_graph(points, chunk_idx)
+
+    def _do_update_graph(self, points=None, chunk_idx=-1):
+        """Dispatch one graph update.
+
+        A progress tick for the waveform already on screen only
+        restyles the persistent per-chunk lines and blits them over the
+        cached background — axes, grid, boundary lines and ticks are
+        never re-rendered.  Anything else (new waveform, idle reset,
+        no data) rebuilds the axes from scratch.
+        """
+        if (chunk_idx >= 0 and points is self._graph_points
+                and self._lc is not None and self._graph_bg is not None):
+            self._update_chunk_state(chunk_idx)
+            return
+        self._build_graph(points, chunk_idx)
+
+    def _xaxis(self, n):
+        """Sample-index x array, reused across rebuilds of the same
+        length (preview → run → resize all replot identical sizes)."""
+        arr = self._xcache.get(n)
+        if arr is None:
+            if len(self._xcache) >= 8:
+                self._xcache.clear()
+            arr = np.arange(n, dtype=np.int32)
+            self._xcache[n] = arr
+        return arr
+
+    def _build_graph(self, points, chunk_idx=-1):
+        """Full rebuild: draw the static background once (axes, grid,
+        chunk boundaries, legend), cache it for blitting, then paint
+        the animated chunk lines on top."""
+        self._graph_points = points
+        self._graph_chunk_idx = chunk_idx
+        self._lc = None
+        self._graph_bg = None
+        self._graph_title = None
         self.ax.clear()
         self._style_ax()
         self.ax.set_xlabel("Sample Index")
         self.ax.set_ylabel("Amplitude (V / A)")
 
-        if not points:
+        if points is None or len(points) == 0:
             self.ax.set_title("No waveform — configure & preview",
                               color=C["text2"], fontsize=11)
             self.canvas.draw_idle()
@@ -1294,47 +1923,106 @@ class App:
 
         n = len(points)
         chunk_sz = MAX_LIST_POINTS
-        chunks = [points[i:i + chunk_sz] for i in range(0, n, chunk_sz)]
-        nc = len(chunks)
-        colors = C["chunk_colors"]
-
-        for ci, ck in enumerate(chunks):
-            start = ci * chunk_sz
-            xs = list(range(start, start + len(ck)))
-            col = colors[ci % len(colors)]
-            lw, alpha = 1.2, 1.0
-
-            if chunk_idx >= 0:               # sending mode
-                if ci < chunk_idx:            # already sent → dim
-                    alpha = 0.30
-                elif ci == chunk_idx:         # currently sending → bold pink
-                    lw, col = 2.8, C["sent"]
-                else:                         # not yet sent
-                    alpha = 0.45
-
-            self.ax.plot(xs, ck, color=col, linewidth=lw, alpha=alpha)
-
-        # chunk boundary lines
-        for ci in range(1, nc):
-            self.ax.axvline(ci * chunk_sz, color=C["border"],
-                            linestyle="--", linewidth=0.7, alpha=0.6)
-
-        # legend (idle mode only)
+        # The plot never needs FP64: one float32 copy halves the data
+        # Matplotlib pushes through Agg, and the chunk slices below
+        # become zero-copy views instead of per-chunk Python lists.
+        # (Upload keeps the original FP64 list.)
+        pts32 = np.asarray(points, dtype=np.float32)
+        x = self._xaxis(n)
+        nc = -(-n // chunk_sz)      # integer ceil
+        palette = C["chunk_colors"]
+        # chunk geometry depends only on the waveform, so derive it once
+        # here instead of re-doing the modulo walk on every tick
+        self._nc = nc
+        colors = [palette[ci % len(palette)] for ci in range(nc)]
+        self._chunk_rgba = np.array([to_rgba(c) for c in colors])
+        self._sent_rgba = to_rgba(C["sent"])
+
+        # All chunks live in one animated LineCollection: a single
+        # vectorized artist — and a single draw call per blit tick —
+        # however many chunks the waveform splits into.  animated=True
+        # keeps it out of ordinary draws; it is painted exclusively
+        # through draw_artist + blit below.
+        segs = [np.column_stack((x[a:min(a + chunk_sz, n)],
+                                 pts32[a:min(a + chunk_sz, n)]))
+                for a in range(0, n, chunk_sz)]
+        self._lc = LineCollection(segs, colors=self._chunk_rgba,
+                                  linewidths=1.2, animated=True)
+        self.ax.add_collection(self._lc, autolim=True)
+        self.ax.autoscale_view()
+
+        # chunk boundary lines (static → part of the cached background):
+        # one LineCollection instead of nc-1 individual axvline artists
+        if nc > 1:
+            self.ax.vlines([ci * chunk_sz for ci in range(1, nc)],
+                           0, 1, transform=self.ax.get_xaxis_transform(),
+                           colors=C["border"], linestyles="--",
+                           linewidths=0.7, alpha=0.6)
+
+        # chunk labels (idle mode only) — hand-rolled with annotate;
+        # a real Legend is one of the slowest artists to construct and
+        # doesn't play well with blitting, while these are plain Text
+        # objects baked into the cached background for free.
         if chunk_idx < 0 and nc > 1:
-            handles = [mlines.Line2D(
-                [], [], color=colors[i % len(colors)], linewidth=2,
-                label=f"Chunk {i+1}  ({len(chunks[i])} pts)")
-                for i in range(nc)]
-            self.ax.legend(handles=handles, fontsize=8, loc="upper right",
-                           facecolor=C["card"], edgecolor=C["border"],
-                           labelcolor=C["text2"])
+            for ci in range(nc):
+                self.ax.annotate(
+                    f"■ Chunk {ci+1}  ({min(chunk_sz, n - ci*chunk_sz)} pts)",
+                    xy=(0.99, 0.97 - ci * 0.045), xycoords="axes fraction",
+                    ha="right", va="top", fontsize=8,
+                    color=colors[ci])
 
         title = (f"Waveform — {n} points, {nc} chunk(s)"
                  if chunk_idx < 0
                  else f"Sending chunk {chunk_idx+1} / {nc} …")
-        self.ax.set_title(title, color=C["text"], fontsize=11)
-        self.fig.tight_layout(pad=1.5)
-        self.canvas.draw_idle()
+        # the title changes per tick, so it blits with the lines
+        self._graph_title = self.ax.set_title(title, color=C["text"],
+                                              fontsize=11)
+        self._graph_title.set_animated(True)
+        # The one legitimate synchronous draw(): the blit background
+        # can't be captured from a deferred draw_idle().  Everything
+        # after this goes through restore_region/draw_artist/blit.
+        self.canvas.draw()          # renders everything except animated
+        self._graph_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._style_chunk_lines(chunk_idx)
+        self._blit_chunk_lines()
+
+    def _update_chunk_state(self, chunk_idx):
+        """Per-tick restyle of the persistent lines + blit.  No clear,
+        no re-plot, no axes work — typically 5-20x cheaper than the
+        full rebuild this replaces."""
+        self._graph_chunk_idx = chunk_idx
+        self._style_chunk_lines(chunk_idx)
+        self._graph_title.set_text(
+            f"Sending chunk {chunk_idx+1} / {self._nc} …")
+        self._blit_chunk_lines()
+
+    def _style_chunk_lines(self, chunk_idx):
+        # whole-collection restyle: two array assignments instead of a
+        # per-chunk Python attribute loop
+        rgba = self._chunk_rgba.copy()
+        lws = np.full(self._nc, 1.2)
+        if chunk_idx >= 0:                     # sending mode
+            rgba[:chunk_idx, 3] = 0.30         # already sent → dim
+            rgba[chunk_idx + 1:, 3] = 0.45     # not yet sent
+            rgba[chunk_idx] = self._sent_rgba  # sending → bold pink
+            lws[chunk_idx] = 2.8
+        self._lc.set_color(rgba)
+        self._lc.set_linewidth(lws)
+
+    def _blit_chunk_lines(self):
+        self.canvas.restore_region(self._graph_bg)
+        self.ax.draw_artist(self._lc)
+        self.ax.draw_artist(self._graph_title)
+        self.canvas.blit(self.fig.bbox)
+
+    def _on_canvas_resize(self, _event):
+        # The cached background no longer matches the canvas size;
+        # rebuild (and recapture) once Tk settles.
+        if self._graph_bg is not None:
+            self._graph_bg = None
+            self.root.after_idle(
+                lambda: self._build_graph(self._graph_points,
+                                          self._graph_chunk_idx))
 
     # ──────────────────────────────────────────────────────────────────────
     #  Auto-discovery
@@ -1359,11 +2047,19 @@ class App:
     def _scan_done(self, results):
         self.scan_btn.configure(state="normal", text="⟳  Scan Network")
         self.progress.set(0)
+        # Drop sockets still held from a previous scan
+        for sock, _port in self._found_socks.values():
+            try:
+                sock.close()
+            except OSError:
+                pass
+        self._found_socks = {}
         if results:
             ips = [r[0] for r in results]
             self.ip_combo.configure(values=ips)
             self.ip_var.set(ips[0])
-            for ip, idn in results:
+            for ip, idn, sock, port in results:
+                self._found_socks[ip] = (sock, port)
                 self.log(f"Found: {ip}  →  {idn}", "ok")
         else:
             self.log("No Kepco devices found on subnet.", "warn")
@@ -1395,20 +2091,27 @@ class App:
                     "Check connection and retry.")
                 return False
 
-        self.man_outp_var.set("OFF")
-        self.man_outp_switch.deselect()
-        self.man_outp_lbl.configure(text="OFF", text_color=C["red"])
-        self.man_volt_entry.delete(0, "end")
-        self.man_volt_entry.insert(0, "0.0")
-        self.man_curr_entry.delete(0, "end")
-        self.man_curr_entry.insert(0, "0.0")
+        if self._man_tab_built:   # manual tab widgets exist only once visited
+            self.man_outp_var.set("OFF")
+            self.man_outp_switch.deselect()
+            self.man_outp_lbl.configure(text="OFF", text_color=C["red"])
+            self.man_volt_entry.delete(0, "end")
+            self.man_volt_entry.insert(0, "0.0")
+            self.man_curr_entry.delete(0, "end")
+            self.man_curr_entry.insert(0, "0.0")
         self.log("Safety interlock: VOLT/CURR set to 0 and output turned OFF.", "ok")
         return True
 
     def _toggle_connect(self):
         if not self.kepco.connected:
             ip = self.ip_var.get().strip()
-            ok, msg = self.kepco.connect(ip)
+            held = self._found_socks.pop(ip, None)
+            if held is not None:
+                ok, msg = self.kepco.adopt(held[0], ip, held[1])
+            else:
+                ok = False
+            if not ok:
+                ok, msg = self.kepco.connect(ip)
             if ok:
                 self.conn_btn.configure(text="Disconnect",
                                         fg_color=C["red"],
@@ -1450,11 +2153,23 @@ class App:
         if not path:
             return
         try:
-            with open(path, "r") as f:
-                self.csv_points = [float(x)
-                                   for row in csv.reader(f)
-                                   for x in row if x.strip()]
-            name = path.rsplit("/", 1)[-1]
+            # Vectorized parse: one C-level pass instead of a Python
+            # float() call per cell.  Commas are normalized to newlines
+            # first so ragged rows (one value per line, multi-column,
+            # trailing commas) all become single-column input.
+            with open(path, "rb") as f:
+                raw = f.read().replace(b",", b"\n")
+            try:
+                data = np.loadtxt(io.BytesIO(raw), dtype=np.float32,
+                                  ndmin=1)
+            except ValueError:
+                # Headers or stray text: genfromtxt turns them into NaN
+                # instead of aborting, so drop those and keep the rest.
+                data = np.genfromtxt(io.BytesIO(raw), dtype=np.float32,
+                                     invalid_raise=False).ravel()
+                data = data[~np.isnan(data)]
+            self.csv_points = data
+            name = os.path.basename(path)
             self.csv_lbl.configure(text=f"{name} ({len(self.csv_points)} pts)")
             self.log(f"Loaded CSV: {name} → {len(self.csv_points)} points", "ok")
         except Exception as e:
@@ -1495,7 +2210,7 @@ class App:
             return None, None, None
 
         if p["wave"] == "CSV Custom":
-            if not self.csv_points:
+            if self.csv_points is None or len(self.csv_points) == 0:
                 messagebox.showerror("Error", "Load a CSV file first.")
                 return None, None, None
             pts = self.csv_points[:actual]
@@ -1506,9 +2221,11 @@ class App:
                 actual_freq = 1.0 / (actual * dwell)
                 warns.append(f"CSV dwell clamped to min {MIN_DWELL*1e6:.0f} µs")
         else:
-            pts = WaveformGen.generate(p["wave"], actual, p["amp"], p["offset"])
+            # rounded key so float re-entry of the same value still hits
+            pts = WaveformGen.generate_cached(
+                p["wave"], actual, round(p["amp"], 6), round(p["offset"], 6))
 
-        nc = math.ceil(len(pts) / MAX_LIST_POINTS)
+        nc = -(-len(pts) // MAX_LIST_POINTS)
         total_time = len(pts) * dwell
         info = [
             f"Points: {len(pts)}   ({nc} chunk{'s' if nc > 1 else ''}  ×  "
@@ -1532,7 +2249,7 @@ class App:
         self.current_points = pts
         self._update_graph(pts)
         self.log(f"Preview: {len(pts)} pts, dwell={dwell*1000:.4f} ms,"
-                 f" {math.ceil(len(pts)/MAX_LIST_POINTS)} chunk(s)")
+                 f" {-(-len(pts) // MAX_LIST_POINTS)} chunk(s)")
 
     # ──────────────────────────────────────────────────────────────────────
     #  Upload & Run  (chunked, background thread)
@@ -1550,6 +2267,7 @@ class App:
         """Restore auto-measure to its previous state."""
         if getattr(self, "_saved_auto_meas", False):
             self.auto_meas_var.set(True)
+            self._meas_next_t = time.monotonic()
             self._man_auto_meas_tick()
 
     def _run(self):
@@ -1598,12 +2316,14 @@ class App:
                 f"loops={'∞' if forever else loops}")
 
             def _progress_cb(sent, total):
-                """Called by upload_list_chunk after each value batch."""
-                pct = sent / max(total, 1)
-                self.root.after(0, lambda p=pct: self.progress.set(p))
-                self.root.after(0, lambda s=sent, t=total:
-                    self.prog_lbl.configure(
-                        text=f"Uploading… {s}/{t} pts"))
+                """Called by upload_list_chunk after each value batch.
+
+                A queue put per batch is cheap; _drain_ui keeps only the
+                newest progress event each tick, so the bar never repaints
+                faster than it drains.
+                """
+                self._ui_q.put(("progress",
+                                sent / max(total, 1), sent, total))
 
             if nc == 1:
                 # ── single chunk: upload → verify → run ──
@@ -1626,26 +2346,32 @@ class App:
                     text="Running…"))
             else:
                 # ── multi-chunk: upload→run→wait each, repeat ──
+                # pack every chunk's command lines once; loop
+                # iterations replay identical bytes instead of
+                # re-formatting the same values each pass
+                packed = [KepcoController._pack_list_cmds(ck, mode)
+                          for ck in chunks]
                 iters = loops if loops > 0 else 1
                 it = 0
                 while not self.stop_event.is_set():
                     it += 1
                     if not forever and it > iters:
                         break
+                    il = "∞" if forever else f"{it}/{iters}"
 
                     for ci, ck in enumerate(chunks):
                         if self.stop_event.is_set():
                             break
 
                         self._ui_chunk(ci, points)
-                        il = "∞" if forever else f"{it}/{iters}"
                         self.root.after(0, lambda c=ci, n=nc, l=il:
                             self.prog_lbl.configure(
                                 text=f"Chunk {c+1}/{n} — loop {l}"))
 
                         # Upload this chunk (with per-batch progress)
                         ok, msg = self.kepco.upload_list_chunk(
-                            ck, dwell, mode, progress_cb=_progress_cb)
+                            ck, dwell, mode, progress_cb=_progress_cb,
+                            packed=packed[ci])
                         if not ok:
                             self._log_safe(
                                 f"Chunk {ci+1} upload failed: {msg}", "err")
@@ -1660,12 +2386,12 @@ class App:
                                 f"Chunk {ci+1} run failed: {msg}", "err")
                             return
 
-                        # Wait for chunk to finish executing + margin
+                        # Wait for chunk to finish executing + margin;
+                        # Event.wait blocks in one syscall and returns
+                        # True the moment stop is requested
                         wait = len(ck) * dwell + 0.10
-                        elapsed = 0.0
-                        while elapsed < wait and not self.stop_event.is_set():
-                            time.sleep(min(0.05, wait - elapsed))
-                            elapsed += 0.05
+                        if self.stop_event.wait(timeout=wait):
+                            break
 
                         pct = (ci + 1) / nc
                         self.root.after(0, lambda p=pct: self.progress.set(p))
@@ -1688,10 +2414,40 @@ class App:
 
     def _ui_chunk(self, idx, pts):
         """Thread-safe graph update."""
-        self.root.after(0, lambda: self._update_graph(pts, chunk_idx=idx))
+        self._ui_q.put(("chunk", idx, pts))
 
     def _log_safe(self, msg, tag="info"):
-        self.root.after(0, lambda: self.log(msg, tag))
+        self._ui_q.put(("log", msg, tag))
+
+    def _drain_ui(self):
+        """Apply queued worker-thread UI events on the Tk thread.
+
+        One recurring 20 ms consumer replaces a root.after(0, lambda)
+        per event: the upload thread only appends tuples to a
+        SimpleQueue, and repeated progress/chunk events collapse to the
+        newest one before anything is repainted — so however chatty the
+        worker gets, the UI sees at most ~50 updates a second.
+        """
+        progress = chunk = None
+        try:
+            for _ in range(200):
+                ev = self._ui_q.get_nowait()
+                kind = ev[0]
+                if kind == "log":
+                    self.log(ev[1], ev[2])
+                elif kind == "chunk":
+                    chunk = ev
+                elif kind == "progress":
+                    progress = ev
+        except _queue.Empty:
+            pass
+        if chunk is not None:
+            self._update_graph(chunk[2], chunk_idx=chunk[1])
+        if progress is not None:
+            _, pct, sent, total = progress
+            self.progress.set(pct)
+            self.prog_lbl.configure(text=f"Uploading… {sent}/{total} pts")
+        self.root.after(20, self._drain_ui)
 
     # ──────────────────────────────────────────────────────────────────────
     #  Stop
@@ -1706,7 +2462,7 @@ class App:
         self.prog_lbl.configure(text="Idle")
         self.progress.set(0)
         self._resume_auto_measure()
-        if self.current_points:
+        if len(self.current_points):
             self._update_graph(self.current_points)
 
     # ──────────────────────────────────────────────────────────────────────